@@ -1,28 +1,306 @@
-import time
-import uuid
-from datetime import datetime, timedelta
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from urllib.parse import quote, urlsplit
 
 import caldav
 import config
 import pytz
-import vobject
-from dateutil.parser import parse
-from icalendar import Calendar, Event
+import requests
+from caldav.elements import cdav
+from dateutil.rrule import rrulestr
+from icalendar import Calendar
 from loguru import logger
-from transit_service import get_apple_maps_url
+from requests.adapters import HTTPAdapter
+from transit_service import get_apple_maps_url, normalize_address
+from urllib3.util.retry import Retry
+from utils import generate_unique_id
+
+# Matches the SUMMARY property line (with optional parameters) in raw iCal text
+SUMMARY_PATTERN = re.compile(r'^SUMMARY[^:\r\n]*:(.*?)\r?$', re.MULTILINE)
+
+# Line folding, property lines and escapes in raw iCal text (RFC 5545)
+ICAL_FOLD_PATTERN = re.compile(r'\r?\n[ \t]')
+ICAL_PROPERTY_PATTERN = re.compile(r'(UID|SUMMARY|LOCATION|DTSTART|DTEND)((?:;(?:[^:;"]|"[^"]*")*)*):(.*)', re.IGNORECASE)
+ICAL_TZID_PATTERN = re.compile(r';TZID="?([^;:"]+)"?', re.IGNORECASE)
+ICAL_ESCAPE_PATTERN = re.compile(r'\\([\\;,nN])')
+ICAL_DATETIME_PATTERN = re.compile(r'(\d{4})(\d{2})(\d{2})(?:T(\d{2})(\d{2})(\d{2})(Z?))?')
+
+# A LOCATION property line, matched case-insensitively like read_event_fields
+LOCATION_PROPERTY_PATTERN = re.compile(r'^LOCATION[;:]', re.IGNORECASE | re.MULTILINE)
+
+# Start of an all-day event in raw iCal text, as written by most clients
+ALL_DAY_DTSTART = '\nDTSTART;VALUE=DATE:'
+
+# Servers evaluate floating times in their own timezone when matching a
+# time-range REPORT, so widen the REPORT and filter to the exact range locally
+FLOATING_TIME_PADDING = timedelta(days=1)
+
+# CalDAV calendar-query REPORT body matching VEVENTs that overlap a UTC time range
+CALENDAR_QUERY_TEMPLATE = """<?xml version="1.0" encoding="utf-8"?>
+<C:calendar-query xmlns:D="DAV:" xmlns:C="urn:ietf:params:xml:ns:caldav">
+  <D:prop>{props}</D:prop>
+  <C:filter>
+    <C:comp-filter name="VCALENDAR">
+      <C:comp-filter name="VEVENT">
+        <C:time-range start="{start}" end="{end}"/>
+      </C:comp-filter>
+    </C:comp-filter>
+  </C:filter>
+</C:calendar-query>"""
+
+# iCal template for transit events; properties must already be escaped and folded
+TRANSIT_EVENT_TEMPLATE = (
+    "BEGIN:VCALENDAR\r\n"
+    "PRODID:-//Transit Calendar//EN\r\n"
+    "VERSION:2.0\r\n"
+    "BEGIN:VEVENT\r\n"
+    "{properties}"
+    "END:VEVENT\r\n"
+    "END:VCALENDAR\r\n"
+)
+
+# Headers for creating transit events: never overwrite an existing object,
+# and skip the response body
+TRANSIT_EVENT_PUT_HEADERS = {
+    "Content-Type": 'text/calendar; charset="utf-8"',
+    "If-None-Match": "*",
+    "Prefer": "return=minimal",
+}
+
+
+@lru_cache(maxsize=1024)
+def parse_ical(data):
+    """Parse raw iCal text, memoized on the text itself
+
+    safe_date_search, the event parse fallback and the summary fallback can
+    all see the same event data, so identical text is only parsed once.
+    Callers must not modify the returned calendar.
+
+    Args:
+        data (str or bytes): Raw iCalendar data
+
+    Returns:
+        icalendar.Calendar: Parsed calendar
+    """
+    return Calendar.from_ical(data)
+
+
+@lru_cache(maxsize=512)
+def get_timezone(tzid):
+    """Resolve a TZID to a pytz timezone, memoized
+
+    Args:
+        tzid (str): Olson timezone name
+
+    Returns:
+        pytz timezone
+    """
+    return pytz.timezone(tzid)
+
+
+@lru_cache(maxsize=1024)
+def read_event_fields(data):
+    """Read UID/SUMMARY/LOCATION/DTSTART/DTEND from raw iCal text
+
+    Only the top-level properties of the first VEVENT are read, so
+    VTIMEZONE and VALARM sub-components are ignored. Memoized on the text,
+    as safe_date_search and _parse_event read the same events; callers
+    must not modify the returned dict.
+
+    Args:
+        data (str or bytes): Raw iCalendar data
+
+    Returns:
+        dict: Event fields, or None if the fast path can't handle the data
+    """
+    if isinstance(data, bytes):
+        data = data.decode('utf-8', errors='replace')
+
+    # Unfold continuation lines (RFC 5545 section 3.1)
+    data = ICAL_FOLD_PATTERN.sub('', data)
+
+    fields = {'uid': None, 'summary': None, 'location': None, 'dtstart': None, 'dtend': None}
+    in_vevent = False
+    depth = 0
+
+    for line in data.splitlines():
+        if not in_vevent:
+            in_vevent = line == 'BEGIN:VEVENT'
+            continue
+
+        if line.startswith('BEGIN:'):
+            depth += 1
+            continue
+        if line.startswith('END:'):
+            if depth == 0:
+                break
+            depth -= 1
+            continue
+        if depth:
+            continue
+
+        match = ICAL_PROPERTY_PATTERN.match(line)
+        if not match:
+            continue
+
+        name, params, value = match.groups()
+        field = name.lower()
+        if field in ('uid', 'summary', 'location'):
+            fields[field] = unescape_ical_text(value)
+        else:
+            fields[field] = parse_ical_datetime(params, value)
+            if fields[field] is None:
+                return None
+
+    return fields if in_vevent else None
+
+
+def parse_ical_datetime(params, value):
+    """Parse an iCal DATE or DATE-TIME value
+
+    Args:
+        params (str): Property parameters, e.g. ";TZID=Europe/London"
+        value (str): Property value, e.g. "20250101T090000Z"
+
+    Returns:
+        datetime or date: Parsed value, or None if it can't be parsed here
+    """
+    try:
+        # Build the datetime from the matched digits directly; strptime
+        # is far slower for this fixed format
+        match = ICAL_DATETIME_PATTERN.fullmatch(value)
+        if not match:
+            return None
+
+        year, month, day, hour, minute, second, utc = match.groups()
+        if hour is None:
+            return datetime(int(year), int(month), int(day)).date()
+
+        if utc:
+            return datetime(int(year), int(month), int(day), int(hour), int(minute), int(second), tzinfo=timezone.utc)
+
+        parsed = datetime(int(year), int(month), int(day), int(hour), int(minute), int(second))
+        tzid = ICAL_TZID_PATTERN.search(params) if params else None
+        if tzid:
+            return get_timezone(tzid.group(1)).localize(parsed)
+
+        return parsed
+    except (ValueError, pytz.UnknownTimeZoneError):
+        # Non-Olson TZIDs (resolved from VTIMEZONE) and unusual formats
+        # are left to icalendar
+        return None
+
+
+def unescape_ical_text(value):
+    """Unescape an iCal TEXT value
+
+    Args:
+        value (str): Escaped value
+
+    Returns:
+        str: Unescaped value
+    """
+    if '\\' not in value:
+        return value
+    return ICAL_ESCAPE_PATTERN.sub(lambda m: '\n' if m.group(1) in 'nN' else m.group(1), value)
+
+
+def to_local_naive(value, tzinfo):
+    """Convert a datetime to naive wall-clock time in a timezone
+
+    Recurrences are expanded in wall-clock time so that instances keep their
+    local time across DST changes.
+
+    Args:
+        value (datetime): Naive or timezone-aware datetime
+        tzinfo: Target timezone
+
+    Returns:
+        datetime: Naive datetime
+    """
+    if value.tzinfo is None:
+        return value
+    local = value.astimezone(tzinfo)
+    if hasattr(tzinfo, 'normalize'):
+        local = tzinfo.normalize(local)
+    return local.replace(tzinfo=None)
+
+
+def localize(value, tzinfo):
+    """Attach a timezone to a naive wall-clock datetime
+
+    Args:
+        value (datetime): Naive datetime
+        tzinfo: Timezone (pytz or standard library)
+
+    Returns:
+        datetime: Timezone-aware datetime
+    """
+    if hasattr(tzinfo, 'localize'):
+        return tzinfo.localize(value)
+    return value.replace(tzinfo=tzinfo)
 
 
 class CalendarService:
     def __init__(self):
         self.source_client = None
         self.source_calendar = None
+        self.source_calendar_id = None
         self.dest_client = None
         self.dest_calendar = None
+        # Parsed events from the last fetch, keyed by (url, etag); None for
+        # events without a usable location
+        self._parse_cache = {}
+        # Pooled HTTP sessions, keyed by (host, username), shared between clients
+        self._http_sessions = {}
+        # Caps concurrent event creates/deletes across all threads, so
+        # concurrent dates can't open more connections than the pool keeps
+        self._write_slots = threading.BoundedSemaphore(config.CALDAV_MAX_WORKERS)
         
     def initialize(self):
         """Initialize connections to calendars"""
         self._connect_source_calendar()
         self._connect_destination_calendar()
+
+    def _get_http_session(self, url, username):
+        """Get a pooled keep-alive HTTP session for a calendar host and user
+
+        Source and destination calendars on the same host with the same login
+        share a session, so their requests reuse the same TCP/TLS connections.
+        Different logins get their own sessions so they never share cookies.
+
+        Args:
+            url (str): Calendar URL
+            username (str): Username the calendar is accessed as
+
+        Returns:
+            requests.Session: HTTP session
+        """
+        key = (urlsplit(url).netloc, username)
+        if key not in self._http_sessions:
+            session = requests.Session()
+            # Keep enough idle connections for the concurrent create/delete
+            # workers (of two overlapping jobs); otherwise urllib3 discards
+            # them and the next batch pays new TCP/TLS handshakes
+            adapter = HTTPAdapter(
+                pool_connections=16,
+                pool_maxsize=max(32, 2 * config.CALDAV_MAX_WORKERS),
+                max_retries=Retry(
+                    total=3,
+                    backoff_factor=0.2,
+                    # Only retry read-only requests when a pooled keep-alive
+                    # connection turns out to be dead. A retried create whose
+                    # first attempt succeeded would fail If-None-Match.
+                    allowed_methods=frozenset({'GET', 'PROPFIND', 'REPORT'})
+                )
+            )
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            self._http_sessions[key] = session
+        return self._http_sessions[key]
         
     def _connect_source_calendar(self):
         """Connect to source calendar"""
@@ -35,12 +313,14 @@ class CalendarService:
                 username=config.SOURCE_CALENDAR_USERNAME,
                 password=config.SOURCE_CALENDAR_PASSWORD
             )
+            self.source_client.session = self._get_http_session(config.SOURCE_CALENDAR_URL, config.SOURCE_CALENDAR_USERNAME)
             
             # Use the provided URL directly instead of discovering calendars
             self.source_calendar = caldav.Calendar(
                 client=self.source_client,
                 url=config.SOURCE_CALENDAR_URL
             )
+            self.source_calendar_id = str(self.source_calendar.url)
             
             # Verify the calendar exists by trying to get a property
             name = self.source_calendar.get_properties([caldav.dav.DisplayName()])
@@ -61,6 +341,7 @@ class CalendarService:
                 username=config.DESTINATION_CALENDAR_USERNAME,
                 password=config.DESTINATION_CALENDAR_PASSWORD
             )
+            self.dest_client.session = self._get_http_session(config.DESTINATION_CALENDAR_URL, config.DESTINATION_CALENDAR_USERNAME)
             
             # Use the provided URL directly instead of discovering calendars
             self.dest_calendar = caldav.Calendar(
@@ -84,36 +365,62 @@ class CalendarService:
             end_date (datetime): End date
             
         Returns:
-            list: List of event dictionaries
+            list: List of event dictionaries. These are shared with the parse
+                cache and must not be modified.
         """
         if not self.source_calendar:
             self._connect_source_calendar()
             
         try:
             logger.info(f"Fetching events from {start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')}")
-                        
-            # FIXED: Use safe_date_search instead of date_search
-            events = self.safe_date_search(
-                self.source_calendar,
-                start_date,
-                end_date,
-                expand=True
-            )
-                
-            # Parse events to our internal format
+
+            # Ensure our comparison dates are timezone-aware
+            search_start = start_date if start_date.tzinfo is not None else start_date.replace(tzinfo=timezone.utc)
+            search_end = end_date if end_date.tzinfo is not None else end_date.replace(tzinfo=timezone.utc)
+
+            # List ETags first and only download events that changed since
+            # the last poll; fall back to downloading everything if the
+            # server won't give us ETags
+            try:
+                parse_cache = self._refresh_parse_cache(search_start, search_end)
+            except Exception as e:
+                logger.warning(f"Could not list event ETags, downloading all events: {str(e)}")
+
+                # FIXED: Use safe_date_search instead of date_search. Keep
+                # events that overlap the range without starting in it, so
+                # the parse cache covers everything the ETag listing returns;
+                # they're filtered by start time below.
+                events = self.safe_date_search(
+                    self.source_calendar,
+                    start_date,
+                    end_date,
+                    expand=False,
+                    starting_within=False
+                )
+                parse_cache = self._build_parse_cache(events)
+
+            # Only keep entries for events that still exist
+            self._parse_cache = parse_cache
+
             parsed_events = []
-            for event in events:
-                try:
-                    event_data = self._parse_event(event)
-                    if event_data:
-                        if event_data.get("location"):
-                            parsed_events.append(event_data)
-                            logger.debug(f"Added event with location: {event_data['title']} - {event_data['location']}")
-                        else:
-                            logger.debug(f"Event has no location: {event_data['title']}")
-                except Exception as e:
-                    logger.error(f"Error parsing specific event: {str(e)}")
-            
+            for entries in parse_cache.values():
+                for event_data in entries:
+                    if not event_data.get("location"):
+                        logger.debug("Event has no location: {}", event_data['title'])
+                        continue
+
+                    # Recurring series are expanded into the instances
+                    # that start within the range
+                    if '_recurrence' in event_data:
+                        instances = self._expand_recurring_event(event_data, search_start, search_end)
+                    elif search_start <= datetime.fromisoformat(event_data['startTime']) <= search_end:
+                        instances = [event_data]
+                    else:
+                        continue
+
+                    parsed_events.extend(instances)
+                    logger.debug("Added {} event(s) with location: {} - {}", len(instances), event_data['title'], event_data['location'])
+
             logger.info(f"Parsed {len(parsed_events)} events with locations")
             return parsed_events
             
@@ -121,6 +428,159 @@ class CalendarService:
             logger.error(f"Error fetching events: {str(e)}")
             return []
 
+    def _refresh_parse_cache(self, start_date, end_date):
+        """Refresh the parse cache from the source calendar's ETags
+
+        Lists the ETag of every event in the time range with a single
+        calendar-query REPORT and downloads (in one calendar-multiget REPORT)
+        only the events whose ETag isn't already in the cache. Events the
+        server returns no ETag for are always downloaded.
+
+        Args:
+            start_date (datetime): Timezone-aware start of the range
+            end_date (datetime): Timezone-aware end of the range
+
+        Returns:
+            dict: Lists of parsed events keyed by (url, etag)
+        """
+        etags = self._get_etags(self.source_calendar, start_date, end_date)
+
+        parse_cache = {}
+        stale_urls = []
+        for url, etag in etags.items():
+            # Without an ETag there's no way to tell if the event changed
+            if etag and (url, etag) in self._parse_cache:
+                parse_cache[(url, etag)] = self._parse_cache[(url, etag)]
+            else:
+                stale_urls.append(url)
+
+        logger.debug("{} of {} events changed since last fetch", len(stale_urls), len(etags))
+
+        if stale_urls:
+            # calendar_multiget needs URL objects, not strings
+            events = self.source_calendar.calendar_multiget(
+                [self.source_calendar.url.join(url) for url in stale_urls]
+            )
+            for event in events:
+                url = str(event.url)
+                parse_cache[(url, etags.get(url))] = self._parse_event_if_located(event)
+
+        return parse_cache
+
+    def _get_etags(self, calendar, start_date, end_date):
+        """Get the ETag of every event in a time range without downloading bodies
+
+        Args:
+            calendar: CalDAV calendar object
+            start_date (datetime): Timezone-aware start of the range
+            end_date (datetime): Timezone-aware end of the range
+
+        Returns:
+            dict: ETags keyed by absolute event URL
+        """
+        results = self._calendar_query(calendar, start_date, end_date, include_data=False)
+        return {url: props.get(caldav.dav.GetEtag.tag) for url, props in results.items()}
+
+    def _time_range_events(self, calendar, start_date, end_date):
+        """Download the events in a time range with a single REPORT
+
+        Args:
+            calendar: CalDAV calendar object
+            start_date (datetime): Timezone-aware start of the range
+            end_date (datetime): Timezone-aware end of the range
+
+        Returns:
+            list: List of CalDAV event objects, with data and ETag loaded
+        """
+        results = self._calendar_query(calendar, start_date, end_date, include_data=True)
+        return [
+            caldav.Event(
+                client=calendar.client,
+                url=url,
+                data=props[cdav.CalendarData.tag],
+                parent=calendar,
+                props={caldav.dav.GetEtag.tag: props.get(caldav.dav.GetEtag.tag)}
+            )
+            for url, props in results.items()
+            if props.get(cdav.CalendarData.tag)
+        ]
+
+    def _calendar_query(self, calendar, start_date, end_date, include_data):
+        """Run a CalDAV calendar-query REPORT filtered to a time range
+
+        Args:
+            calendar: CalDAV calendar object
+            start_date (datetime): Timezone-aware start of the range
+            end_date (datetime): Timezone-aware end of the range
+            include_data (bool): Also return the iCal data of each event
+
+        Returns:
+            dict: Properties keyed by absolute event URL
+        """
+        props = [caldav.dav.GetEtag()]
+        if include_data:
+            props.append(cdav.CalendarData())
+
+        query = CALENDAR_QUERY_TEMPLATE.format(
+            props="<D:getetag/><C:calendar-data/>" if include_data else "<D:getetag/>",
+            start=start_date.astimezone(timezone.utc).strftime('%Y%m%dT%H%M%SZ'),
+            end=end_date.astimezone(timezone.utc).strftime('%Y%m%dT%H%M%SZ')
+        )
+
+        response = calendar.client.report(str(calendar.url), query, depth=1)
+        properties = response.expand_simple_props(props)
+
+        return {str(calendar.url.join(href)): result for href, result in properties.items()}
+
+    def _build_parse_cache(self, events):
+        """Parse downloaded events, reusing cached results where possible
+
+        Args:
+            events (list): CalDAV event objects
+
+        Returns:
+            dict: Lists of parsed events keyed by parse cache key
+        """
+        parse_cache = {}
+        for event in events:
+            cache_key = self._get_parse_cache_key(event)
+            if cache_key in self._parse_cache:
+                parse_cache[cache_key] = self._parse_cache[cache_key]
+            else:
+                parse_cache[cache_key] = self._parse_event_if_located(event)
+        return parse_cache
+
+    def _parse_event_if_located(self, caldav_event):
+        """Parse a CalDAV event, skipping events without a location
+
+        Args:
+            caldav_event: A CalDAV event
+
+        Returns:
+            list: Event data in our internal format (empty if skipped). A
+                recurring event yields its series plus any moved instances.
+        """
+        try:
+            # Events without a location are dropped anyway, so skip
+            # parsing them with a cheap regex check
+            if not LOCATION_PROPERTY_PATTERN.search(caldav_event.data):
+                logger.debug("Event has no location, skipping parse")
+                return []
+
+            if '\nRRULE' in caldav_event.data:
+                return self._parse_recurring_event(caldav_event)
+
+            # All-day events are dropped anyway, so skip parsing them too
+            if ALL_DAY_DTSTART in caldav_event.data:
+                logger.debug("Event is all-day, skipping parse")
+                return []
+
+            event_data = self._parse_event(caldav_event)
+            return [event_data] if event_data else []
+        except Exception as e:
+            logger.error(f"Error parsing specific event: {str(e)}")
+            return []
+
     def fetch_recently_updated_events(self):
         """Fetch recently updated events
         
@@ -133,6 +593,18 @@ class CalendarService:
         
         return self.fetch_events(start_date, end_date)
     
+    def _get_parse_cache_key(self, caldav_event):
+        """Get the parse cache key for a CalDAV event
+
+        Args:
+            caldav_event: A CalDAV event
+
+        Returns:
+            tuple: (url, etag), or (url, raw data) if the server sent no ETag
+        """
+        etag = caldav_event.props.get(caldav.dav.GetEtag.tag) if caldav_event.props else None
+        return str(caldav_event.url), etag or caldav_event.data
+
     def _parse_event(self, caldav_event):
         """Parse a CalDAV event to our internal format
         
@@ -143,61 +615,215 @@ class CalendarService:
             dict: Event data in our internal format
         """
         try:
-            # Parse the iCalendar data
-            vcal = vobject.readOne(caldav_event.data)
-            vevent = vcal.vevent
-            
-            # Get event properties
-            uid = str(vevent.uid.value) if hasattr(vevent, 'uid') else str(uuid.uuid4())
-            summary = vevent.summary.value if hasattr(vevent, 'summary') else "No Title"
-            location = vevent.location.value if hasattr(vevent, 'location') else ""
-
-            if location:
-                from transit_service import normalize_address
-                location = normalize_address(location)
-            
-            # Get start and end times
-            if hasattr(vevent, 'dtstart'):
-                dtstart = vevent.dtstart.value
-                # Skip all-day events as they're not relevant for transit
-                if not isinstance(dtstart, datetime):
-                    return None
-                start_time = dtstart
-            else:
+            # Read just the fields we need from the raw iCal text, falling back
+            # to a full icalendar parse for anything the fast path can't handle
+            fields = read_event_fields(caldav_event.data)
+            if fields is None:
+                fields = self._read_event_fields_icalendar(caldav_event.data)
+
+            return self._build_event_data(fields)
+
+        except Exception as e:
+            logger.error(f"Error parsing event: {str(e)}")
+            return None
+
+    def _build_event_data(self, fields):
+        """Build our internal event format from raw event fields
+
+        Args:
+            fields (dict): Event fields as returned by read_event_fields
+
+        Returns:
+            dict: Event data in our internal format, or None for all-day events
+        """
+        # Get event properties
+        uid = fields['uid'] or generate_unique_id()
+        summary = fields['summary'] or "No Title"
+        location = fields['location'] or ""
+
+        if location:
+            location = normalize_address(location)
+        
+        # Get start and end times
+        if fields['dtstart'] is not None:
+            dtstart = fields['dtstart']
+            # Skip all-day events as they're not relevant for transit
+            if not isinstance(dtstart, datetime):
                 return None
-                
-            if hasattr(vevent, 'dtend'):
-                dtend = vevent.dtend.value
-                # Skip all-day events as they're not relevant for transit
-                if not isinstance(dtend, datetime):
-                    return None
-                end_time = dtend
-            else:
-                # If no end time, use start time + 1 hour
-                end_time = start_time + timedelta(hours=1)
-            
-            # Ensure timezone awareness
-            if start_time.tzinfo is None:
-                start_time = pytz.utc.localize(start_time)
-            if end_time.tzinfo is None:
-                end_time = pytz.utc.localize(end_time)
-                
-            # Create event data
-            event_data = {
-                "id": uid,
-                "title": summary,
-                "location": location,
-                "startTime": start_time.isoformat(),
-                "endTime": end_time.isoformat(),
-                "calendarId": str(self.source_calendar.url)
-            }
+            start_time = dtstart
+        else:
+            return None
             
-            return event_data
+        if fields['dtend'] is not None:
+            dtend = fields['dtend']
+            # Skip all-day events as they're not relevant for transit
+            if not isinstance(dtend, datetime):
+                return None
+            end_time = dtend
+        else:
+            # If no end time, use start time + 1 hour
+            end_time = start_time + timedelta(hours=1)
+        
+        # Ensure timezone awareness
+        if start_time.tzinfo is None:
+            start_time = start_time.replace(tzinfo=timezone.utc)
+        if end_time.tzinfo is None:
+            end_time = end_time.replace(tzinfo=timezone.utc)
             
+        # Create event data
+        event_data = {
+            "id": uid,
+            "title": summary,
+            "location": location,
+            "startTime": start_time.isoformat(),
+            "endTime": end_time.isoformat(),
+            "calendarId": self.source_calendar_id
+        }
+        
+        return event_data
+
+    def _parse_recurring_event(self, caldav_event):
+        """Parse a recurring CalDAV event into its series and moved instances
+
+        The series is returned with its recurrence set (in wall-clock time)
+        under "_recurrence" for _expand_recurring_event; instances overridden
+        with a RECURRENCE-ID are excluded from the set and returned as
+        separate events.
+
+        Args:
+            caldav_event: A CalDAV event with an RRULE
+
+        Returns:
+            list: Event data in our internal format
+        """
+        try:
+            series = None
+            overrides = []
+            for vevent in parse_ical(caldav_event.data).walk('VEVENT'):
+                if 'RECURRENCE-ID' in vevent:
+                    overrides.append(vevent)
+                elif series is None:
+                    series = vevent
+
+            if series is None or 'RRULE' not in series:
+                event_data = self._parse_event(caldav_event)
+                return [event_data] if event_data else []
+
+            fields = self._read_vevent_fields(series)
+            event_data = self._build_event_data(fields)
+            if not event_data:
+                return []
+
+            dtstart = fields['dtstart']
+            tzinfo = dtstart.tzinfo or timezone.utc
+
+            rrule = series['RRULE']
+            if isinstance(rrule, list):
+                rrule = rrule[0]
+            recurrence = rrulestr(
+                rrule.to_ical().decode(),
+                dtstart=to_local_naive(dtstart, tzinfo),
+                forceset=True,
+                ignoretz=True
+            )
+
+            for name, add in (('EXDATE', recurrence.exdate), ('RDATE', recurrence.rdate)):
+                values = series.get(name, [])
+                for value in values if isinstance(values, list) else [values]:
+                    for date_value in value.dts:
+                        if isinstance(date_value.dt, datetime):
+                            add(to_local_naive(date_value.dt, tzinfo))
+
+            entries = []
+            for vevent in overrides:
+                recurrence_id = vevent['RECURRENCE-ID'].dt
+                if not isinstance(recurrence_id, datetime):
+                    continue
+
+                instance_start = to_local_naive(recurrence_id, tzinfo)
+                recurrence.exdate(instance_start)
+
+                override_data = self._build_event_data(self._read_vevent_fields(vevent))
+                if override_data:
+                    override_data['id'] = f"{override_data['id']}_{instance_start:%Y%m%dT%H%M%S}"
+                    entries.append(override_data)
+
+            end_time = datetime.fromisoformat(event_data['endTime'])
+            duration = end_time - datetime.fromisoformat(event_data['startTime'])
+
+            event_data['_recurrence'] = (recurrence, tzinfo, duration)
+            entries.append(event_data)
+            return entries
+
         except Exception as e:
-            logger.error(f"Error parsing event: {str(e)}")
-            return None
-    
+            logger.error(f"Error parsing recurring event: {str(e)}")
+            return []
+
+    def _expand_recurring_event(self, event_data, start_date, end_date):
+        """Expand a recurring series into the instances starting in a range
+
+        Args:
+            event_data (dict): Series as returned by _parse_recurring_event
+            start_date (datetime): Timezone-aware start of the range
+            end_date (datetime): Timezone-aware end of the range
+
+        Returns:
+            list: Event data for each instance, with a per-instance id
+        """
+        recurrence, tzinfo, duration = event_data['_recurrence']
+
+        instances = []
+        for occurrence in recurrence.between(to_local_naive(start_date, tzinfo), to_local_naive(end_date, tzinfo), inc=True):
+            instance_start = localize(occurrence, tzinfo)
+            instance = {key: value for key, value in event_data.items() if key != '_recurrence'}
+            instance.update(
+                id=f"{event_data['id']}_{occurrence:%Y%m%dT%H%M%S}",
+                startTime=instance_start.isoformat(),
+                endTime=(instance_start + duration).isoformat()
+            )
+            instances.append(instance)
+
+        return instances
+
+    def _read_event_fields_icalendar(self, data):
+        """Read UID/SUMMARY/LOCATION/DTSTART/DTEND with a full icalendar parse
+
+        Args:
+            data (str or bytes): Raw iCalendar data
+
+        Returns:
+            dict: Event fields
+        """
+        return self._read_vevent_fields(self._read_vevent(data))
+
+    def _read_vevent_fields(self, vevent):
+        """Read UID/SUMMARY/LOCATION/DTSTART/DTEND from a parsed VEVENT
+
+        Args:
+            vevent (icalendar.Event): VEVENT component
+
+        Returns:
+            dict: Event fields
+        """
+        return {
+            'uid': str(vevent['UID']) if 'UID' in vevent else None,
+            'summary': str(vevent['SUMMARY']) if 'SUMMARY' in vevent else None,
+            'location': str(vevent['LOCATION']) if 'LOCATION' in vevent else None,
+            'dtstart': vevent['DTSTART'].dt if 'DTSTART' in vevent else None,
+            'dtend': vevent['DTEND'].dt if 'DTEND' in vevent else None,
+        }
+
+    def _read_vevent(self, data):
+        """Parse raw iCal text and return its first VEVENT
+
+        Args:
+            data (str or bytes): Raw iCalendar data
+
+        Returns:
+            icalendar.Event: First VEVENT component
+        """
+        return parse_ical(data).walk('VEVENT')[0]
+
     def create_transit_event(self, transit_event):
         """Create a transit event on the destination calendar
         
@@ -211,39 +837,66 @@ class CalendarService:
             self._connect_destination_calendar()
             
         try:
-            # Create iCalendar event
-            cal = Calendar()
-            cal.add('prodid', '-//Transit Calendar//EN')
-            cal.add('version', '2.0')
-            
-            event = Event()
-            event.add('uid', transit_event['id'])
-            event.add('summary', transit_event['title'])
-            
-            # Create Apple Maps link in description
-            apple_maps_url = get_apple_maps_url(
-                transit_event['origin'],
-                transit_event['destination']
-            )
-            
-            # Set description with Apple Maps link
-            event.add('description', f"{apple_maps_url}")
-            
-            # Add start and end times
-            start_time = parse(transit_event['startTime'])
-            end_time = parse(transit_event['endTime'])
-            
-            event.add('dtstart', start_time)
-            event.add('dtend', end_time)
-            
-            # Add to calendar
-            cal.add_component(event)
-            
-            # Create calendar object
-            ical_str = cal.to_ical()
-            
-            # Save to destination calendar
-            self.dest_calendar.save_event(ical_str)
+            ical_str = self._build_transit_ical(transit_event)
+        except Exception as e:
+            logger.error(f"Error creating transit event: {str(e)}")
+            return False
+
+        return self._save_transit_ical(transit_event, ical_str)
+
+    def _build_transit_ical(self, transit_event):
+        """Build the iCal payload for a transit event
+
+        Args:
+            transit_event (dict): Transit event data
+
+        Returns:
+            bytes: iCalendar data
+        """
+        # Create Apple Maps link in description
+        apple_maps_url = get_apple_maps_url(
+            transit_event['origin'],
+            transit_event['destination']
+        )
+        
+        # Add start and end times
+        start_time = datetime.fromisoformat(transit_event['startTime'].replace("Z", "+00:00"))
+        end_time = datetime.fromisoformat(transit_event['endTime'].replace("Z", "+00:00"))
+        
+        # Transit events always have the same shape, so fill in the
+        # iCal template directly rather than building icalendar components
+        properties = (
+            f"UID:{self._escape_ical_text(transit_event['id'])}",
+            f"SUMMARY:{self._escape_ical_text(transit_event['title'])}",
+            f"DESCRIPTION:{self._escape_ical_text(apple_maps_url)}",
+            f"DTSTART:{self._format_ical_datetime(start_time)}",
+            f"DTEND:{self._format_ical_datetime(end_time)}",
+        )
+        return TRANSIT_EVENT_TEMPLATE.format(
+            properties=''.join(self._fold_ical_line(line) for line in properties)
+        ).encode('utf-8')
+
+    def _save_transit_ical(self, transit_event, ical_str):
+        """Save a transit event's iCal payload to the destination calendar
+
+        Args:
+            transit_event (dict): Transit event data
+            ical_str (bytes): iCalendar data, or None if it couldn't be built
+
+        Returns:
+            bool: Success or failure
+        """
+        if ical_str is None:
+            return False
+
+        try:
+            # PUT straight to the destination calendar. save_event() would
+            # re-parse the payload we just built only to find its UID.
+            url = self.dest_calendar.url.join(quote(transit_event['id']) + '.ics')
+            with self._write_slots:
+                response = self.dest_client.put(str(url), ical_str, TRANSIT_EVENT_PUT_HEADERS)
+            if response.status not in (200, 201, 204):
+                raise Exception(f"PUT {url} returned {response.status} {response.reason}")
             
             logger.info(f"Created transit event: {transit_event['title']}")
             return True
@@ -252,6 +905,146 @@ class CalendarService:
             logger.error(f"Error creating transit event: {str(e)}")
             return False
     
+    def _escape_ical_text(self, value):
+        """Escape a value for an iCal TEXT property
+
+        Args:
+            value (str): Unescaped value
+
+        Returns:
+            str: Escaped value
+        """
+        return (
+            value.replace('\\', '\\\\')
+            .replace(';', '\\;')
+            .replace(',', '\\,')
+            .replace('\r\n', '\\n')
+            .replace('\n', '\\n')
+        )
+
+    def _format_ical_datetime(self, value):
+        """Format a datetime as an iCal DATE-TIME value
+
+        Timezone-aware datetimes are written in UTC; naive ones are written
+        as floating times.
+
+        Args:
+            value (datetime): Datetime to format
+
+        Returns:
+            str: iCal DATE-TIME value
+        """
+        if value.tzinfo is None:
+            return value.strftime('%Y%m%dT%H%M%S')
+        return value.astimezone(timezone.utc).strftime('%Y%m%dT%H%M%SZ')
+
+    def _fold_ical_line(self, line):
+        """Fold an iCal content line at 75 octets and terminate it
+
+        Lines are measured in UTF-8 octets (RFC 5545 section 3.1) and never
+        split inside a multi-byte character.
+
+        Args:
+            line (str): Content line
+
+        Returns:
+            str: Folded content line ending in CRLF
+        """
+        encoded = line.encode('utf-8')
+        if len(encoded) <= 75:
+            return line + "\r\n"
+
+        parts = []
+        start = 0
+        # Continuation lines start with a space, leaving 74 octets of content
+        limit = 75
+        while start < len(encoded):
+            end = min(start + limit, len(encoded))
+            # Back up to the start of a character rather than split it
+            while end < len(encoded) and encoded[end] & 0xC0 == 0x80:
+                end -= 1
+            parts.append(encoded[start:end].decode('utf-8'))
+            start = end
+            limit = 74
+        return "\r\n ".join(parts) + "\r\n"
+
+    def create_transit_events(self, transit_events):
+        """Create several transit events on the destination calendar concurrently
+
+        Args:
+            transit_events (list): List of transit event data dicts
+
+        Returns:
+            list: Success or failure for each transit event, in order
+        """
+        if not transit_events:
+            return []
+
+        if not self.dest_calendar:
+            self._connect_destination_calendar()
+
+        # Build the payloads up front - this is CPU work threads can't speed up
+        icals = []
+        for transit_event in transit_events:
+            try:
+                icals.append(self._build_transit_ical(transit_event))
+            except Exception as e:
+                logger.error(f"Error creating transit event: {str(e)}")
+                icals.append(None)
+
+        # Only the saves run concurrently, each an independent PUT round-trip
+        with ThreadPoolExecutor(max_workers=min(config.CALDAV_MAX_WORKERS, len(transit_events))) as executor:
+            return list(executor.map(self._save_transit_ical, transit_events, icals))
+
+    def _get_event_summary(self, caldav_event):
+        """Get the summary of a CalDAV event for logging
+
+        Uses a regex over the raw iCal text so we don't build a full icalendar
+        tree just to log a title. Falls back to icalendar on a regex miss.
+
+        Args:
+            caldav_event: A CalDAV event
+
+        Returns:
+            str: Event summary
+        """
+        try:
+            data = caldav_event.data
+            if isinstance(data, bytes):
+                data = data.decode('utf-8', errors='replace')
+
+            match = SUMMARY_PATTERN.search(data)
+            if match:
+                return match.group(1)
+
+            vevent = self._read_vevent(data)
+            return str(vevent['SUMMARY']) if 'SUMMARY' in vevent else "No Title"
+        except Exception as e:
+            logger.error(f"Error getting event summary: {str(e)}")
+            return "Unknown"
+
+    def _delete_event(self, caldav_event):
+        """Delete a single event from its calendar
+
+        Args:
+            caldav_event: A CalDAV event
+
+        Returns:
+            bool: Success or failure
+        """
+        try:
+            # The summary is only needed for logging, so only extract it at DEBUG
+            summary = lambda: self._get_event_summary(caldav_event)
+
+            logger.opt(lazy=True).debug("Deleting event: {}", summary)
+            with self._write_slots:
+                caldav_event.delete()
+            logger.opt(lazy=True).debug("Successfully deleted event: {}", summary)
+            return True
+        except Exception as e:
+            logger.error(f"Error deleting specific event: {str(e)}")
+            return False
+
     def delete_transit_events_for_date(self, date):
         """Delete transit events for a specific date
         
@@ -265,50 +1058,35 @@ class CalendarService:
             self._connect_destination_calendar()
             
         try:
-            # Convert to datetime if needed
-            if isinstance(date, str):
-                date = datetime.strptime(date, '%Y-%m-%d')
+            # Convert to datetime if needed; fromisoformat is much cheaper
+            # than strptime for our YYYY-MM-DD strings
+            if not isinstance(date, datetime):
+                date = datetime.fromisoformat(date)
                     
-            start_of_day = date.replace(hour=0, minute=0, second=0, microsecond=0)
-            end_of_day = date.replace(hour=23, minute=59, second=59, microsecond=999999)
+            start_of_day = datetime(date.year, date.month, date.day, tzinfo=date.tzinfo)
+            end_of_day = start_of_day + timedelta(days=1, microseconds=-1)
             
-            logger.debug(f"Searching for events to delete between {start_of_day} and {end_of_day}")
+            logger.debug("Searching for events to delete between {} and {}", start_of_day, end_of_day)
             
+            # Transit events are never recurring, so there is nothing to expand
             events = self.safe_date_search(
                 self.dest_calendar,
                 start_of_day,
                 end_of_day,
-                expand=True
+                expand=False
             )
             
-            logger.debug(f"Found {len(events)} events to delete")
+            logger.debug("Found {} events to delete", len(events))
             
-            # Delete each event
-            count = 0
-            for event in events:
-                try:
-                    # Get event summary for logging
-                    try:
-                        vcal = vobject.readOne(event.data)
-                        vevent = vcal.vevent
-                        summary = vevent.summary.value if hasattr(vevent, 'summary') else "No Title"
-                    except Exception as e:
-                        logger.error(f"Error getting event summary: {str(e)}")
-                        summary = "Unknown"
-                    
-                    logger.debug(f"Deleting event: {summary}")
-                    
-                    # Delete the event
-                    event.delete()
-                    
-                    # Wait briefly to allow server to process the deletion
-                    time.sleep(0.5)
-                    
-                    count += 1
-                    logger.debug(f"Successfully deleted event: {summary}")
-                except Exception as e:
-                    logger.error(f"Error deleting specific event: {str(e)}")
-                    
+            # Delete events concurrently - each delete is an independent HTTP round-trip.
+            # Most days have no or a single transit event, so skip the pool for those.
+            if len(events) <= 1:
+                results = [self._delete_event(event) for event in events]
+            else:
+                with ThreadPoolExecutor(max_workers=min(config.CALDAV_MAX_WORKERS, len(events))) as executor:
+                    results = list(executor.map(self._delete_event, events))
+
+            count = sum(results)
             logger.info(f"Deleted {count} transit events for date {date.strftime('%Y-%m-%d')}")
             return count
                 
@@ -316,50 +1094,83 @@ class CalendarService:
             logger.error(f"Error deleting transit events: {str(e)}")
             return 0
         
-    def safe_date_search(self, calendar, start_date, end_date, expand=True):
+    def safe_date_search(self, calendar, start_date, end_date, expand=True, starting_within=True):
         """
         Safe replacement for calendar.date_search() that avoids cache bugs.
 
-        This method uses calendar.events() + manual filtering instead of date_search()
-        to avoid the cache bug where date_search() returns stale data after deletions.
+        This method sends its own time-range calendar-query REPORT + manual filtering
+        instead of date_search() to avoid the cache bug where date_search() returns
+        stale data after deletions. If the server rejects the REPORT it falls back to
+        scanning calendar.events().
 
         Args:
             calendar: CalDAV calendar object
             start_date (datetime): Start date for search
             end_date (datetime): End date for search
-            expand (bool): Ignored (kept for API compatibility)
+            expand (bool): Expand recurrences server-side (only used by the date_search fallback)
+            starting_within (bool): Only return events starting within the range, rather
+                than every event overlapping it
 
         Returns:
             list: List of CalDAV event objects within the date range
         """
         try:
-            # Get all events from the calendar (this method doesn't have the cache bug)
-            all_events = calendar.events()
-
             # Ensure our comparison dates are timezone-aware
-            search_start = start_date if start_date.tzinfo is not None else pytz.utc.localize(start_date)
-            search_end = end_date if end_date.tzinfo is not None else pytz.utc.localize(end_date)
+            search_start = start_date if start_date.tzinfo is not None else start_date.replace(tzinfo=timezone.utc)
+            search_end = end_date if end_date.tzinfo is not None else end_date.replace(tzinfo=timezone.utc)
+
+            try:
+                # Let the server narrow the calendar down to the time range
+                if starting_within:
+                    all_events = self._time_range_events(
+                        calendar,
+                        search_start - FLOATING_TIME_PADDING,
+                        search_end + FLOATING_TIME_PADDING
+                    )
+                else:
+                    all_events = self._time_range_events(calendar, search_start, search_end)
+            except Exception as e:
+                logger.warning(f"Time-range REPORT failed, scanning the full calendar: {str(e)}")
+                # Get all events from the calendar (this method doesn't have the cache bug)
+                all_events = calendar.events()
 
-            # Filter events that fall within the date range
+            if not starting_within:
+                return all_events
+
+            # The server matches events overlapping the range; we only want
+            # events starting within it
             filtered_events = []
 
             for event in all_events:
                 try:
-                    # Parse the event to get its start time
-                    vcal = vobject.readOne(event.data)
-                    vevent = vcal.vevent
+                    # Recurring series may have instances in the range even
+                    # if the first one isn't; they're expanded by the caller
+                    if '\nRRULE' in event.data:
+                        filtered_events.append(event)
+                        continue
 
-                    if not hasattr(vevent, 'dtstart'):
+                    # Skip all-day events without reading their fields
+                    if ALL_DAY_DTSTART in event.data:
                         continue
 
-                    dtstart = vevent.dtstart.value
+                    # Get the event's start time from the raw iCal text,
+                    # only parsing the whole event if the fast path can't
+                    fields = read_event_fields(event.data)
+                    if fields is not None:
+                        dtstart = fields['dtstart']
+                    else:
+                        vevent = self._read_vevent(event.data)
+                        dtstart = vevent['DTSTART'].dt if 'DTSTART' in vevent else None
+
+                    if dtstart is None:
+                        continue
 
                     # Skip all-day events (they're date objects, not datetime)
                     if not isinstance(dtstart, datetime):
                         continue
 
                     # Ensure timezone awareness for comparison
-                    event_start = dtstart if dtstart.tzinfo is not None else pytz.utc.localize(dtstart)
+                    event_start = dtstart if dtstart.tzinfo is not None else dtstart.replace(tzinfo=timezone.utc)
 
                     # Check if event falls within the date range
                     if search_start <= event_start <= search_end:
@@ -367,7 +1178,7 @@ class CalendarService:
 
                 except Exception as e:
                     # Log the error but continue processing other events
-                    logger.debug(f"Error filtering event in safe_date_search: {str(e)}")
+                    logger.debug("Error filtering event in safe_date_search: {}", e)
                     continue
 
             return filtered_events
@@ -1,11 +1,10 @@
 import os
-from pathlib import Path
 
 from dotenv import load_dotenv
 
-# Load environment variables
-env_path = Path('') / '.env'
-load_dotenv(dotenv_path=env_path)
+# Load environment variables from .env, without overriding any already
+# injected into the environment (e.g. by docker-compose)
+load_dotenv(dotenv_path='.env', override=False)
 
 # Calendar settings
 SOURCE_CALENDAR_URL = os.getenv('SOURCE_CALENDAR_URL')
@@ -25,9 +24,15 @@ ALERT_EMAIL_FROM = os.getenv('ALERT_EMAIL_FROM')
 ALERT_EMAIL_TO = os.getenv('ALERT_EMAIL_TO')
 SMTP_USE_TLS = os.getenv('SMTP_USE_TLS', 'true').lower() == 'true'
 
+# Maximum number of concurrent CalDAV requests for bulk operations (at least 1)
+CALDAV_MAX_WORKERS = max(1, int(os.getenv('CALDAV_MAX_WORKERS', '8')))
+
 # HERE API settings
 HERE_API_KEY = os.getenv('HERE_API_KEY')
 
+# Maximum number of concurrent HERE API requests (at least 1)
+HERE_MAX_WORKERS = max(1, int(os.getenv('HERE_MAX_WORKERS', '8')))
+
 # Home location and transit defaults
 HOME_ADDRESS = os.getenv('HOME_ADDRESS')
 DEFAULT_TRANSIT_MODE = os.getenv('DEFAULT_TRANSIT_MODE', 'transit')  # transit, driving, walking, cycling
@@ -46,10 +51,7 @@ DB_PATH = os.getenv('DB_PATH', '../data/transit-calendar.sqlite')
 
 # Ensure database directory exists
 DB_DIR = os.path.dirname(DB_PATH)
-Path(DB_DIR).mkdir(parents=True, exist_ok=True)
-
-# Ensure data directory exists
-Path(DB_PATH).parent.mkdir(parents=True, exist_ok=True)
+os.makedirs(DB_DIR or '.', exist_ok=True)
 
 # Database URL
 DB_URL = f"sqlite:///{DB_PATH}"
@@ -1,21 +1,66 @@
 import hashlib
 import os
-from contextlib import contextmanager
 from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
 from typing import Set
-from typing_extensions import Buffer, cast
 
 import config
 from loguru import logger
-from sqlalchemy import Column, DateTime, String, create_engine, inspect
+from sqlalchemy import Column, DateTime, Float, Index, String, bindparam, create_engine, delete, event, insert, select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import StaticPool
+from sqlalchemy.orm import scoped_session, sessionmaker
+from sqlalchemy.pool import QueuePool
+
+
+@lru_cache(maxsize=4096)
+def parse_iso_datetime(value):
+    """Parse an ISO 8601 timestamp, caching results across update checks
+
+    Args:
+        value (str): ISO 8601 timestamp, optionally ending in "Z"
+
+    Returns:
+        datetime: Parsed datetime
+    """
+    # Only older Pythons need "Z" spelled out, and our own timestamps never use it
+    if value.endswith("Z"):
+        value = value[:-1] + "+00:00"
+    return datetime.fromisoformat(value)
+
+
+@lru_cache(maxsize=4096)
+def hash_event_fields(title, location, start_time, end_time):
+    """Hash the event fields relevant to transit, for change detection
+
+    Unchanged events hash the same fields on every update check, so results
+    are cached rather than re-encoded and re-hashed.
+
+    Args:
+        title (str): Event title
+        location (str): Event location
+        start_time (datetime): Event start time
+        end_time (datetime): Event end time
+
+    Returns:
+        str: Hex digest
+    """
+    # We only care about title, location and timing for transit purposes
+    hash_input = f"{title}|{location}|{start_time.isoformat()}|{end_time.isoformat()}"
+    return hashlib.blake2b(hash_input.encode(), digest_size=16).hexdigest()
+
+
+# Set once the database directory has been verified writable
+db_directory_ready = False
 
 
 def ensure_db_directory():
     """Ensure the database directory exists with proper permissions"""
+    global db_directory_ready
+    if db_directory_ready:
+        return True
+
     db_dir = os.path.dirname(config.DB_PATH)
 
     try:
@@ -33,11 +78,12 @@ def ensure_db_directory():
         os.remove(test_file)
         logger.info(f"Successfully verified write access to {db_dir}")
 
+        db_directory_ready = True
         return True
     except Exception as e:
         logger.error(f"Failed to create or access database directory: {str(e)}")
         logger.error(f"DB directory: {db_dir}, current working dir: {os.getcwd()}")
-        logger.error(f"Directory listing: {os.listdir(os.getcwd())}")
+        logger.error(f"Current working dir has {sum(1 for _ in os.scandir(os.getcwd()))} entries")
         return False
 
 
@@ -51,10 +97,35 @@ engine = create_engine(
         "check_same_thread": False,
         "timeout": 30  # More generous timeout
     },
-    poolclass=StaticPool,
+    poolclass=QueuePool,
+    # Every CalDAV and HERE worker thread may hold a connection at once
+    # (scoped_session gives each thread its own), so size the overflow to match
+    pool_size=1,
+    max_overflow=config.CALDAV_MAX_WORKERS + config.HERE_MAX_WORKERS,
     echo=False
 )
 
+
+@event.listens_for(engine, "connect")
+def set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Tune SQLite for our write-heavy workload on each new connection
+
+    WAL lets readers and the writer proceed concurrently and, with
+    synchronous=NORMAL, avoids an fsync on every commit.
+    """
+    cursor = dbapi_connection.cursor()
+    for pragma in (
+        # Only takes effect on a new database, before any tables exist
+        "auto_vacuum=INCREMENTAL",
+        "journal_mode=WAL",
+        "synchronous=NORMAL",
+        "temp_store=MEMORY",
+        "mmap_size=268435456",
+        "cache_size=-65536"
+    ):
+        cursor.execute(f"PRAGMA {pragma}")
+    cursor.close()
+
 # Create base class for models
 Base = declarative_base()
 
@@ -62,6 +133,7 @@ Base = declarative_base()
 # Define models
 class Event(Base):
     __tablename__ = "events"
+    __table_args__ = (Index("ix_events_date_start", "date", "start_time"),)
 
     id = Column(String, primary_key=True)
     title = Column(String)
@@ -78,6 +150,7 @@ class Event(Base):
 
 class TransitEvent(Base):
     __tablename__ = "transit_events"
+    __table_args__ = (Index("ix_transit_events_date", "date"),)
 
     id = Column(String, primary_key=True)
     title = Column(String)
@@ -94,6 +167,7 @@ class TransitEvent(Base):
 
 class ProcessedEvent(Base):
     __tablename__ = "processed_events"
+    __table_args__ = (Index("ix_processed_events_date", "date"),)
 
     id = Column(String, primary_key=True)
     title = Column(String)
@@ -106,8 +180,72 @@ class ProcessedEvent(Base):
         return f"<ProcessedEvent(id='{self.id}', title='{self.title}', date='{self.date}')>"
 
 
-# Create a session factory
-Session = sessionmaker(bind=engine)
+class GeocodedAddress(Base):
+    __tablename__ = "geocoded_addresses"
+
+    address = Column(String, primary_key=True)  # Normalized address
+    longitude = Column(Float)
+    latitude = Column(Float)
+    updated_at = Column(DateTime, default=datetime.now)
+
+    def __repr__(self):
+        return f"<GeocodedAddress(address='{self.address}', longitude={self.longitude}, latitude={self.latitude})>"
+
+
+# Create a thread-local session registry shared across the app. Objects stay
+# usable after commit so query results can be returned from a closed session.
+Session = scoped_session(sessionmaker(bind=engine, expire_on_commit=False))
+
+# Statements for the lookups run on every update check, built once so only
+# their parameters change between calls
+EVENT_IDS_QUERY = select(Event.id).where(Event.id.in_(bindparam("ids", expanding=True)))
+PROCESSED_HASHES_QUERY = select(ProcessedEvent.id, ProcessedEvent.hash_value).where(
+    ProcessedEvent.id.in_(bindparam("ids", expanding=True))
+)
+EVENTS_FOR_DATE_QUERY = select(Event).where(Event.date == bindparam("date")).order_by(Event.start_time)
+LOCATED_EVENT_ROWS_FOR_DATE_QUERY = select(
+    Event.id, Event.title, Event.location, Event.start_time, Event.end_time
+).where(
+    Event.date == bindparam("date"), Event.location.isnot(None), Event.location != ""
+).order_by(Event.start_time)
+TRANSIT_EVENTS_FOR_DATE_QUERY = select(TransitEvent).where(TransitEvent.date == bindparam("date"))
+GEOCODED_ADDRESS_QUERY = select(GeocodedAddress.longitude, GeocodedAddress.latitude).where(
+    GeocodedAddress.address == bindparam("address")
+)
+
+# Upserts for saving events, updating every column but the key (and, for
+# events, the calendar they were first seen on)
+event_insert = sqlite_insert(Event)
+EVENT_UPSERT = event_insert.on_conflict_do_update(
+    index_elements=[Event.id],
+    set_={name: event_insert.excluded[name] for name in ("title", "location", "start_time", "end_time", "date", "updated_at")}
+)
+processed_event_insert = sqlite_insert(ProcessedEvent)
+PROCESSED_EVENT_UPSERT = processed_event_insert.on_conflict_do_update(
+    index_elements=[ProcessedEvent.id],
+    set_={name: processed_event_insert.excluded[name] for name in ("title", "location", "date", "hash_value", "last_processed")}
+)
+geocoded_address_insert = sqlite_insert(GeocodedAddress)
+GEOCODED_ADDRESS_UPSERT = geocoded_address_insert.on_conflict_do_update(
+    index_elements=[GeocodedAddress.address],
+    set_={name: geocoded_address_insert.excluded[name] for name in ("longitude", "latitude", "updated_at")}
+)
+
+
+def run_sqlite_script(script):
+    """Run SQL statements on a raw SQLite connection, outside any transaction
+
+    Unlike execute(), which steps a statement only once, executescript() runs
+    each statement to completion, as pragmas like incremental_vacuum need.
+
+    Args:
+        script (str): Semicolon-separated SQL statements
+    """
+    connection = engine.raw_connection()
+    try:
+        connection.driver_connection.executescript(script)
+    finally:
+        connection.close()
 
 
 def initialize_db():
@@ -120,13 +258,25 @@ def initialize_db():
         return False
 
     try:
-        # Check if we need to migrate the database
-        inspector = inspect(engine)
-
         # Create all tables that don't exist
         Base.metadata.create_all(engine)
 
-        logger.info(f"Database initialized with tables: {', '.join(inspector.get_table_names())}")
+        # create_all skips existing tables, so add any indexes missing from
+        # databases created before they were defined
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                index.create(engine, checkfirst=True)
+
+        # Setting auto_vacuum on a database that already has tables only takes
+        # effect after a VACUUM, so convert older databases once
+        with engine.connect() as connection:
+            auto_vacuum = connection.exec_driver_sql("PRAGMA auto_vacuum").scalar()
+        if auto_vacuum != 2:
+            logger.info("Converting database to incremental auto-vacuum")
+            run_sqlite_script("VACUUM")
+
+        # Every table in our metadata now exists, so there's no need to ask SQLite
+        logger.info(f"Database initialized with tables: {', '.join(Base.metadata.tables)}")
         return True
     except Exception as e:
         logger.error(f"Failed to initialize database: {str(e)}")
@@ -140,144 +290,109 @@ def save_event(event_data):
         event_data (dict): Event data including id, title, location, startTime, endTime, calendarId
 
     Returns:
-        tuple: (date_str, event_changed) where:
-            - date_str (str): The date of the event in YYYY-MM-DD format
-            - event_changed (bool): True if event was updated, False if unchanged
+        tuple: (date_str, event_changed) as returned by save_events
     """
-    # Parse datetime objects
-    start_time = datetime.fromisoformat(event_data["startTime"].replace("Z", "+00:00"))
-    end_time = datetime.fromisoformat(event_data["endTime"].replace("Z", "+00:00"))
-
-    # Format date as YYYY-MM-DD
-    date_str = start_time.strftime('%Y-%m-%d')
-
-    # Step 1: Save the full event data to the Events table
-    update_event_record(event_data, start_time, end_time, date_str)
+    return save_events([event_data])[0]
 
-    # Step 2: Check if the event has changed since last processing
-    event_changed = check_event_changes(event_data, start_time, date_str)
 
-    return date_str, event_changed
+def save_events(event_datas, now=None):
+    """Store events in the database and check which have changed
 
-
-def update_event_record(event_data, start_time, end_time, date_str):
-    """Update or create a record in the Events table
+    All events are saved in one session. The change-detection hashes are
+    looked up with one query, and only new and changed events (or events
+    missing from the Events table) are written, with one upsert per table.
 
     Args:
-        event_data (dict): Event data
-        start_time (datetime): Parsed start time
-        end_time (datetime): Parsed end time
-        date_str (str): Formatted date string
-    """
-    session = Session()
-
-    try:
-        # Check if event exists in Events table
-        existing_event = session.query(Event).filter(Event.id == event_data["id"]).first()
-
-        if existing_event:
-            # Update existing event record
-            logger.debug(f"Updating existing event record for {event_data['id']}")
-            existing_event.title = event_data["title"]
-            existing_event.location = event_data.get("location", "")
-            existing_event.start_time = start_time
-            existing_event.end_time = end_time
-            existing_event.date = date_str
-            existing_event.updated_at = datetime.now()
-        else:
-            # Create new event record
-            logger.debug(f"Creating new event record for {event_data['id']}")
-            new_event = Event(
-                id=event_data["id"],
-                title=event_data["title"],
-                location=event_data.get("location", ""),
-                start_time=start_time,
-                end_time=end_time,
-                date=date_str,
-                calendar_id=event_data["calendarId"],
-                updated_at=datetime.now()
-            )
-            session.add(new_event)
-
-        session.commit()
-    except Exception as e:
-        session.rollback()
-        logger.error(f"Error updating event record: {str(e)}")
-        raise
-    finally:
-        session.close()
-
-
-@contextmanager
-def get_session():
-    session = Session()
-    try:
-        yield session
-    finally:
-        session.close()
-
-
-def check_event_changes(event_data, start_time, date_str):
-    """Check if an event has changed since it was last processed
-
-    Args:
-        event_data (dict): Event data
-        start_time (datetime): Parsed start time
-        date_str (str): Formatted date string
+        event_datas (list): Event data dicts including id, title, location, startTime, endTime, calendarId
+        now (datetime): Timestamp to record as updated/processed time, defaults to now
 
     Returns:
-        bool: True if event changed or is new, False if unchanged
+        list: (date_str, event_changed) tuples in the same order as event_datas, where:
+            - date_str (str): The date of the event in YYYY-MM-DD format
+            - event_changed (bool): True if event is new or was updated, False if unchanged
     """
+    if not event_datas:
+        return []
 
-    with get_session() as session:
+    now = now or datetime.now()
+    event_records = {}
+    processed_records = {}
+
+    for event_data in event_datas:
+        # Parse datetime objects
+        start_time = parse_iso_datetime(event_data["startTime"])
+        end_time = parse_iso_datetime(event_data["endTime"])
+
+        # The date is the YYYY-MM-DD prefix of the ISO timestamp
+        date_str = event_data["startTime"][:10]
+        location = event_data.get("location", "")
+
+        # Create hash value for change detection
+        hash_value = hash_event_fields(event_data['title'], location, start_time, end_time)
+
+        event_records[event_data["id"]] = {
+            "id": event_data["id"],
+            "title": event_data["title"],
+            "location": location,
+            "start_time": start_time,
+            "end_time": end_time,
+            "date": date_str,
+            "calendar_id": event_data["calendarId"],
+            "updated_at": now
+        }
+        processed_records[event_data["id"]] = {
+            "id": event_data["id"],
+            "title": event_data["title"],
+            "location": location,
+            "date": date_str,
+            "hash_value": hash_value,
+            "last_processed": now
+        }
+
+    with Session() as session:
         try:
-            # Create hash value for change detection
-            # We only care about title, location and start_time for transit purposes
-            hash_input = f"{event_data['title']}|{event_data.get('location', '')}|{start_time.isoformat()}"
-            hash_value = hashlib.md5(cast(Buffer, hash_input.encode())).hexdigest()
-
-            # Check if we've processed this event before
-            processed_event = session.query(ProcessedEvent).filter(ProcessedEvent.id == event_data["id"]).first()
-
-            if not processed_event:
-                # This is a new event we haven't seen before
-                logger.debug(f"New event {event_data['id']} being processed for the first time")
-
-                # Create new processed event record
-                new_processed_event = ProcessedEvent(
-                    id=event_data["id"],
-                    title=event_data["title"],
-                    location=event_data.get("location", ""),
-                    date=date_str,
-                    hash_value=hash_value,
-                    last_processed=datetime.now()
-                )
-                session.add(new_processed_event)
-                session.commit()
-
-                # New events always need processing
-                return True
-            else:
-                # We've seen this event before, check if it changed
-                if processed_event.hash_value == hash_value:
-                    # Hash hasn't changed, event details relevant to transit are unchanged
-                    logger.debug(f"Event {event_data['id']} unchanged since last processing")
-                    return False
-                else:
-                    # Event has changed, update the processed event record
-                    logger.debug(f"Event {event_data['id']} changed since last processing")
-                    processed_event.title = event_data["title"]
-                    processed_event.location = event_data.get("location", "")
-                    processed_event.date = date_str
-                    processed_event.hash_value = hash_value
-                    processed_event.last_processed = datetime.now()
-                    session.commit()
-                    return True
+            ids = list(event_records)
+
+            # Look up which events we've processed before
+            processed_hashes = dict(session.execute(PROCESSED_HASHES_QUERY, {"ids": ids}).all())
+
+            new_processed = [record for event_id, record in processed_records.items() if event_id not in processed_hashes]
+            changed_processed = [
+                record for event_id, record in processed_records.items()
+                if event_id in processed_hashes and processed_hashes[event_id] != record["hash_value"]
+            ]
+            unchanged_ids = [
+                event_id for event_id, record in processed_records.items()
+                if processed_hashes.get(event_id) == record["hash_value"]
+            ]
+
+            # Step 1: Save the full event data to the Events table, skipping
+            # unchanged events that are already stored
+            stored_unchanged_ids = set(session.execute(EVENT_IDS_QUERY, {"ids": unchanged_ids}).scalars()) if unchanged_ids else set()
+            event_upserts = [record for event_id, record in event_records.items() if event_id not in stored_unchanged_ids]
+            if event_upserts:
+                session.execute(EVENT_UPSERT, event_upserts)
+
+            # Step 2: Record events that are new or changed since last processing
+            if new_processed or changed_processed:
+                session.execute(PROCESSED_EVENT_UPSERT, new_processed + changed_processed)
+
+            session.commit()
+
+            logger.debug(f"Saved {len(event_records)} events: {len(new_processed)} new, "
+                         f"{len(changed_processed)} changed since last processing")
         except Exception as e:
             session.rollback()
-            logger.error(f"Error checking event changes: {str(e)}")
-            # If there's an error, return True to ensure processing happens
-            return True
+            logger.error(f"Error saving events: {str(e)}")
+            raise
+
+    return [
+        (
+            processed_records[event_data["id"]]["date"],
+            processed_hashes.get(event_data["id"]) != processed_records[event_data["id"]]["hash_value"]
+        )
+        for event_data in event_datas
+    ]
 
 
 def detect_deleted_events(current_event_ids: Set[str]) -> Set[str]:
@@ -289,50 +404,44 @@ def detect_deleted_events(current_event_ids: Set[str]) -> Set[str]:
     Returns:
         Set[str]: Set of date strings (YYYY-MM-DD) that had events deleted
     """
-    session = Session()
     dates_with_deletions = set()
 
-    try:
-        # Get the date range we care about (today + look forward days)
-        now = datetime.now()
-        start_date = now.strftime('%Y-%m-%d')
-        end_date = (now + timedelta(days=config.LOOK_FORWARD_DAYS)).strftime('%Y-%m-%d')
-
-        # Find all events in our database within the date range
-        stored_events = session.query(Event).filter(
-            Event.date >= start_date,
-            Event.date <= end_date
-        ).all()
+    with Session() as session:
+        try:
+            # Get the date range we care about (today + look forward days)
+            now = datetime.now()
+            start_date = now.strftime('%Y-%m-%d')
+            end_date = (now + timedelta(days=config.LOOK_FORWARD_DAYS)).strftime('%Y-%m-%d')
 
-        # Check which stored events are no longer in the current calendar
-        for stored_event in stored_events:
-            if stored_event.id not in current_event_ids:
-                logger.info(f"Detected deleted event: {stored_event.title} on {stored_event.date}")
-                dates_with_deletions.add(stored_event.date)
+            # Find all events in our database within the date range
+            stored_events = session.execute(
+                select(Event.id, Event.title, Event.date).where(Event.date.between(start_date, end_date))
+            ).all()
 
-                # Remove the event from our database
-                session.delete(stored_event)
+            # Check which stored events are no longer in the current calendar
+            deleted_ids = []
+            for stored_event in stored_events:
+                if stored_event.id not in current_event_ids:
+                    logger.info(f"Detected deleted event: {stored_event.title} on {stored_event.date}")
+                    dates_with_deletions.add(stored_event.date)
+                    deleted_ids.append(stored_event.id)
 
-                # Also remove from processed events to clean up
-                processed_event = session.query(ProcessedEvent).filter(
-                    ProcessedEvent.id == stored_event.id
-                ).first()
-                if processed_event:
-                    session.delete(processed_event)
+            if deleted_ids:
+                # Remove the events from our database, and from processed events to clean up
+                session.execute(delete(Event).where(Event.id.in_(deleted_ids)))
+                session.execute(delete(ProcessedEvent).where(ProcessedEvent.id.in_(deleted_ids)))
 
-        session.commit()
+            session.commit()
 
-        if dates_with_deletions:
-            logger.info(f"Found deletions on {len(dates_with_deletions)} dates: {sorted(dates_with_deletions)}")
+            if dates_with_deletions:
+                logger.info(f"Found deletions on {len(dates_with_deletions)} dates: {sorted(dates_with_deletions)}")
 
-        return dates_with_deletions
+            return dates_with_deletions
 
-    except Exception as e:
-        session.rollback()
-        logger.error(f"Error detecting deleted events: {str(e)}")
-        return set()
-    finally:
-        session.close()
+        except Exception as e:
+            session.rollback()
+            logger.error(f"Error detecting deleted events: {str(e)}")
+            return set()
 
 
 def cleanup_orphaned_events_for_date(date_str: str):
@@ -344,23 +453,20 @@ def cleanup_orphaned_events_for_date(date_str: str):
     Args:
         date_str (str): Date in YYYY-MM-DD format
     """
-    session = Session()
-
-    try:
-        # Remove any remaining event records for this date
-        # (These would be events that were deleted from calendar but are still in our DB)
-        deleted_count = session.query(Event).filter(Event.date == date_str).delete()
+    with Session() as session:
+        try:
+            # Remove any remaining event records for this date
+            # (These would be events that were deleted from calendar but are still in our DB)
+            deleted_count = session.query(Event).filter(Event.date == date_str).delete()
 
-        if deleted_count > 0:
-            logger.info(f"Cleaned up {deleted_count} orphaned event records for date {date_str}")
+            if deleted_count > 0:
+                logger.info(f"Cleaned up {deleted_count} orphaned event records for date {date_str}")
 
-        session.commit()
+            session.commit()
 
-    except Exception as e:
-        session.rollback()
-        logger.error(f"Error cleaning up orphaned events for date {date_str}: {str(e)}")
-    finally:
-        session.close()
+        except Exception as e:
+            session.rollback()
+            logger.error(f"Error cleaning up orphaned events for date {date_str}: {str(e)}")
 
 
 def get_events_for_date(date):
@@ -372,18 +478,34 @@ def get_events_for_date(date):
     Returns:
         list: List of Event objects
     """
-    session = Session()
-
-    try:
+    with Session() as session:
         if isinstance(date, datetime):
             date_str = date.strftime('%Y-%m-%d')
         else:
             date_str = date
 
-        events = session.query(Event).filter(Event.date == date_str).order_by(Event.start_time).all()
+        events = session.execute(EVENTS_FOR_DATE_QUERY, {"date": date_str}).scalars().all()
         return events
-    finally:
-        session.close()
+
+
+def get_located_event_rows_for_date(date):
+    """Get the fields of the events with a location on a specific date
+
+    Rows come back ordered by start time, without loading ORM objects.
+
+    Args:
+        date (str or datetime): The date to get events for
+
+    Returns:
+        list: Rows with id, title, location, start_time and end_time attributes
+    """
+    with Session() as session:
+        if isinstance(date, datetime):
+            date_str = date.strftime('%Y-%m-%d')
+        else:
+            date_str = date
+
+        return session.execute(LOCATED_EVENT_ROWS_FOR_DATE_QUERY, {"date": date_str}).all()
 
 
 def save_transit_event(transit_event):
@@ -392,37 +514,45 @@ def save_transit_event(transit_event):
     Args:
         transit_event (dict): Transit event data
     """
-    session = Session()
+    save_transit_events([transit_event])
 
-    try:
-        # Parse datetime objects
-        start_time = datetime.fromisoformat(transit_event["startTime"].replace("Z", "+00:00"))
-        end_time = datetime.fromisoformat(transit_event["endTime"].replace("Z", "+00:00"))
-
-        # Format date as YYYY-MM-DD
-        date_str = start_time.strftime('%Y-%m-%d')
-
-        # Create new transit event
-        new_transit_event = TransitEvent(
-            id=transit_event["id"],
-            title=transit_event["title"],
-            origin=transit_event["origin"],
-            destination=transit_event["destination"],
-            start_time=start_time,
-            end_time=end_time,
-            date=date_str,
-            created_at=datetime.now()
-        )
 
-        session.add(new_transit_event)
-        session.commit()
+def save_transit_events(transit_events, now=None):
+    """Store transit events in one session with a single bulk insert
 
-    except Exception as e:
-        session.rollback()
-        logger.error(f"Error saving transit event: {str(e)}")
-        raise
-    finally:
-        session.close()
+    Args:
+        transit_events (list): Transit event data dicts
+        now (datetime): Timestamp to record as creation time, defaults to now
+    """
+    if not transit_events:
+        return
+
+    now = now or datetime.now()
+
+    with Session() as session:
+        try:
+            records = [
+                {
+                    "id": transit_event["id"],
+                    "title": transit_event["title"],
+                    "origin": transit_event["origin"],
+                    "destination": transit_event["destination"],
+                    "start_time": parse_iso_datetime(transit_event["startTime"]),
+                    "end_time": parse_iso_datetime(transit_event["endTime"]),
+                    # The date is the YYYY-MM-DD prefix of the ISO timestamp
+                    "date": transit_event["startTime"][:10],
+                    "created_at": now
+                }
+                for transit_event in transit_events
+            ]
+
+            session.execute(insert(TransitEvent), records)
+            session.commit()
+
+        except Exception as e:
+            session.rollback()
+            logger.error(f"Error saving transit events: {str(e)}")
+            raise
 
 
 def get_transit_events_for_date(date):
@@ -434,18 +564,14 @@ def get_transit_events_for_date(date):
     Returns:
         list: List of TransitEvent objects
     """
-    session = Session()
-
-    try:
+    with Session() as session:
         if isinstance(date, datetime):
             date_str = date.strftime('%Y-%m-%d')
         else:
             date_str = date
 
-        transit_events = session.query(TransitEvent).filter(TransitEvent.date == date_str).all()
+        transit_events = session.execute(TRANSIT_EVENTS_FOR_DATE_QUERY, {"date": date_str}).scalars().all()
         return transit_events
-    finally:
-        session.close()
 
 
 def delete_transit_events_for_date(date):
@@ -457,23 +583,59 @@ def delete_transit_events_for_date(date):
     Returns:
         int: Number of events deleted
     """
-    session = Session()
+    with Session() as session:
+        try:
+            if isinstance(date, datetime):
+                date_str = date.strftime('%Y-%m-%d')
+            else:
+                date_str = date
 
-    try:
-        if isinstance(date, datetime):
-            date_str = date.strftime('%Y-%m-%d')
-        else:
-            date_str = date
+            result = session.query(TransitEvent).filter(TransitEvent.date == date_str).delete()
+            session.commit()
+            return result
+        except Exception as e:
+            session.rollback()
+            logger.error(f"Error deleting transit events: {str(e)}")
+            raise
 
-        result = session.query(TransitEvent).filter(TransitEvent.date == date_str).delete()
-        session.commit()
-        return result
-    except Exception as e:
-        session.rollback()
-        logger.error(f"Error deleting transit events: {str(e)}")
-        raise
-    finally:
-        session.close()
+
+def get_geocoded_address(address):
+    """Get the stored coordinates of a previously geocoded address
+
+    Args:
+        address (str): Normalized address
+
+    Returns:
+        list: [longitude, latitude] or None if the address hasn't been geocoded
+    """
+    with Session() as session:
+        try:
+            row = session.execute(GEOCODED_ADDRESS_QUERY, {"address": address}).first()
+            return [row.longitude, row.latitude] if row else None
+        except Exception as e:
+            logger.error(f"Error getting geocoded address: {str(e)}")
+            return None
+
+
+def save_geocoded_address(address, coordinates):
+    """Store the coordinates of a geocoded address
+
+    Args:
+        address (str): Normalized address
+        coordinates (list): [longitude, latitude]
+    """
+    with Session() as session:
+        try:
+            session.execute(GEOCODED_ADDRESS_UPSERT, {
+                "address": address,
+                "longitude": coordinates[0],
+                "latitude": coordinates[1],
+                "updated_at": datetime.now()
+            })
+            session.commit()
+        except Exception as e:
+            session.rollback()
+            logger.error(f"Error saving geocoded address: {str(e)}")
 
 
 def cleanup_old_data(days=7):
@@ -482,24 +644,26 @@ def cleanup_old_data(days=7):
     Args:
         days (int): Number of days to keep
     """
-    session = Session()
+    with Session() as session:
+        try:
+            cutoff_date = (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d')
 
-    try:
-        cutoff_date = (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d')
+            # Delete old events
+            session.execute(delete(Event).where(Event.date < cutoff_date))
 
-        # Delete old events
-        session.query(Event).filter(Event.date < cutoff_date).delete()
+            # Delete old transit events
+            session.execute(delete(TransitEvent).where(TransitEvent.date < cutoff_date))
 
-        # Delete old transit events
-        session.query(TransitEvent).filter(TransitEvent.date < cutoff_date).delete()
+            # We keep ProcessedEvent records longer to avoid reprocessing
+            # when events reappear due to recurrence
 
-        # We keep ProcessedEvent records longer to avoid reprocessing
-        # when events reappear due to recurrence
+            session.commit()
 
-        session.commit()
-        logger.info(f"Cleaned up data older than {cutoff_date}")
-    except Exception as e:
-        session.rollback()
-        logger.error(f"Error cleaning up old data: {str(e)}")
-    finally:
-        session.close()
\ No newline at end of file
+            # Return freed pages to the filesystem and refresh the planner's
+            # index statistics
+            run_sqlite_script("PRAGMA incremental_vacuum; ANALYZE;")
+
+            logger.info(f"Cleaned up data older than {cutoff_date}")
+        except Exception as e:
+            session.rollback()
+            logger.error(f"Error cleaning up old data: {str(e)}")
\ No newline at end of file
@@ -1,77 +1,80 @@
+import heapq
 import os
 import signal
 import sys
-import time
-from typing import Optional
+import threading
+from datetime import datetime, time, timedelta
+from typing import Callable, List, Optional, Tuple
 
 import config
-from apscheduler.schedulers.background import BackgroundScheduler
 from loguru import logger
 import smtplib
 from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
 
 from calendar_service import calendar_service
 from database import cleanup_old_data, initialize_db
 from scheduler import check_for_calendar_updates, process_daily_update
 
-from functools import wraps
-import signal
+# SMTP connection reused across alerts, only used from loguru's queue worker
+smtp_server: Optional[smtplib.SMTP] = None
+
+def get_smtp_server():
+    """Get a connected SMTP server, reusing the last connection if it's still alive"""
+    global smtp_server
+    if smtp_server is not None:
+        try:
+            smtp_server.noop()
+            return smtp_server
+        except (smtplib.SMTPException, OSError):
+            smtp_server = None
+
+    server = smtplib.SMTP(config.SMTP_SERVER, config.SMTP_PORT, timeout=10)
+    if config.SMTP_USE_TLS:
+        server.starttls()
+    if config.SMTP_USERNAME:
+        server.login(config.SMTP_USERNAME, config.SMTP_PASSWORD)
+    smtp_server = server
+    return server
 
 # Add email alert handler for errors
 def email_handler(message):
     """Handler for sending email alerts on ERROR/CRITICAL logs"""
     try:
-        msg = MIMEMultipart()
-        msg['From'] = config.ALERT_EMAIL_FROM
-        msg['To'] = config.ALERT_EMAIL_TO
-        msg['Subject'] = "Transit Calendar Alert"
-        
         body = f"""
         Transit Calendar Error Alert
         
         {message}
         """
         
-        msg.attach(MIMEText(body, 'plain'))
+        # The alert is a single plain-text part, so skip the multipart wrapper
+        msg = MIMEText(body, 'plain')
+        msg['From'] = config.ALERT_EMAIL_FROM
+        msg['To'] = config.ALERT_EMAIL_TO
+        msg['Subject'] = "Transit Calendar Alert"
         
-        server = smtplib.SMTP(config.SMTP_SERVER, config.SMTP_PORT)
-        if config.SMTP_USE_TLS:
-            server.starttls()
-        if config.SMTP_USERNAME:
-            server.login(config.SMTP_USERNAME, config.SMTP_PASSWORD)
-        server.send_message(msg)
-        server.quit()
+        get_smtp_server().send_message(msg)
     except Exception as e:
+        # Drop the connection so the next alert reconnects
+        global smtp_server
+        smtp_server = None
         # Use print instead of logger to avoid recursion
         print(f"Failed to send alert email: {e}")
 
-# Add with custom format that includes level info
+# Add with custom format that includes level info. Alerts are queued and sent
+# from a background thread so logging an error never waits on SMTP.
 logger.add(
     email_handler, 
     level="ERROR",
+    enqueue=True,
     format="{time} | {level} | {name} | {message}"
 )
 
-def timeout_handler(signum, frame):
-    raise TimeoutError("Job execution timeout")
-
-def with_timeout(seconds):
-    def decorator(func):
-        @wraps(func)
-        def wrapper(*args, **kwargs):
-            signal.signal(signal.SIGALRM, timeout_handler)
-            signal.alarm(seconds)
-            try:
-                result = func(*args, **kwargs)
-            finally:
-                signal.alarm(0)
-            return result
-        return wrapper
-    return decorator
+# Calendar checks more than this late are skipped rather than run; the next
+# one is never far off. Daily and weekly jobs always run, however late.
+MISFIRE_GRACE_TIME = timedelta(minutes=5)
 
-# Global scheduler
-scheduler: Optional[BackgroundScheduler] = None
+# Set by signal_handler to wake the main thread for shutdown
+shutdown_event = threading.Event()
 
 def setup_logging_directories():
     """Setup logging to ensure log directory exists"""
@@ -84,58 +87,92 @@ def setup_logging_directories():
     logger.info(f"Log file: {config.LOG_FILE}")
     logger.info(f"Environment variables: DB_PATH={os.environ.get('DB_PATH')}, LOG_FILE={os.environ.get('LOG_FILE')}")
 
-@with_timeout(600)
-def setup_scheduler():
-    """Set up the scheduler with all required jobs"""
-    global scheduler
-    scheduler = BackgroundScheduler()
-    
-    # Calendar check job - runs every X minutes
-    scheduler.add_job(
-        check_for_calendar_updates,
-        'interval',
-        minutes=config.CALENDAR_CHECK_INTERVAL,
-        id='calendar_check',
-        replace_existing=True,
-        max_instances=1,  # Explicitly limit to 1 instance
-        coalesce=True,    # Combine missed runs into one
-        misfire_grace_time=300  # Allow 5 minutes grace period
-    )
-    
-    # Daily update job - runs at configured time
-    scheduler.add_job(
-        process_daily_update,
-        'cron',
-        hour=config.DAILY_UPDATE_HOUR,
-        minute=config.DAILY_UPDATE_MINUTE,
-        id='daily_update',
-        replace_existing=True
-    )
-    
-    # Weekly cleanup job - runs on Sunday at 2 AM
-    scheduler.add_job(
-        cleanup_old_data,
-        'cron',
-        day_of_week=6,
-        hour=2,
-        minute=0,
-        id='weekly_cleanup',
-        replace_existing=True
-    )
-    
-    return scheduler
+def interval_trigger(minutes: int) -> Callable[[datetime], datetime]:
+    """Trigger that fires every given number of minutes"""
+    return lambda after: after + timedelta(minutes=minutes)
+
+def next_cron_time(after: datetime, hour: int, minute: int, day_of_week: Optional[int] = None) -> datetime:
+    """First time of day hour:minute (on a Monday=0 weekday, if given) strictly after a time"""
+    run_time = datetime.combine(after.date(), time(hour, minute))
+    while run_time <= after or (day_of_week is not None and run_time.weekday() != day_of_week):
+        run_time += timedelta(days=1)
+    return run_time
+
+def cron_trigger(hour: int, minute: int, day_of_week: Optional[int] = None) -> Callable[[datetime], datetime]:
+    """Trigger that fires daily (or weekly, on a Monday=0 weekday) at a time of day"""
+    return lambda after: next_cron_time(after, hour, minute, day_of_week)
+
+def next_fire_time(trigger: Callable[[datetime], datetime], run_time: datetime, now: datetime) -> datetime:
+    """Next run time after a run scheduled for run_time, combining any runs missed before now"""
+    next_run_time = trigger(run_time)
+    if next_run_time <= now:
+        next_run_time = trigger(now)
+    return next_run_time
+
+def is_misfire(run_time: datetime, now: datetime, grace_time: Optional[timedelta]) -> bool:
+    """Whether a run scheduled for run_time is too late to run now"""
+    return grace_time is not None and now - run_time > grace_time
+
+# (id, job, trigger, misfire grace time or None to always run late jobs)
+Job = Tuple[str, Callable, Callable[[datetime], datetime], Optional[timedelta]]
+
+def setup_scheduler() -> List[Job]:
+    """Set up all required jobs"""
+    return [
+        # Calendar check job - runs every X minutes
+        ('calendar_check', check_for_calendar_updates, interval_trigger(config.CALENDAR_CHECK_INTERVAL), MISFIRE_GRACE_TIME),
+        # Daily update job - runs at configured time
+        ('daily_update', process_daily_update, cron_trigger(config.DAILY_UPDATE_HOUR, config.DAILY_UPDATE_MINUTE), None),
+        # Weekly cleanup job - runs on Sunday at 2 AM
+        ('weekly_cleanup', cleanup_old_data, cron_trigger(2, 0, day_of_week=6), None),
+    ]
+
+def run_scheduler(jobs: List[Job]):
+    """Run jobs on the calling thread until a shutdown signal arrives
+
+    Jobs are kept in a heap ordered by next run time, and the thread sleeps
+    until the earliest one is due. Jobs run one at a time, so the same job
+    never runs concurrently, and runs missed while another job was running
+    are combined into one. A late run is skipped only if the job has a misfire
+    grace time and it has passed.
+
+    Args:
+        jobs (list): (id, job, trigger, misfire grace time) tuples, where trigger
+            maps a time to the next run time after it
+    """
+    now = datetime.now()
+    queue = [(trigger(now), job_id, job, trigger, grace_time) for job_id, job, trigger, grace_time in jobs]
+    heapq.heapify(queue)
+
+    while not shutdown_event.is_set():
+        run_time, job_id, job, trigger, grace_time = queue[0]
+
+        # Wait for the next job, waking early on shutdown
+        delay = (run_time - datetime.now()).total_seconds()
+        if delay > 0:
+            shutdown_event.wait(delay)
+            continue
+
+        heapq.heappop(queue)
+        if is_misfire(run_time, datetime.now(), grace_time):
+            logger.warning(f"Skipping run of job {job_id} scheduled for {run_time} - missed by too long")
+        else:
+            try:
+                job()
+            except Exception as e:
+                logger.error(f"Error running job {job_id}: {str(e)}")
+
+        # Schedule the next run, combining any runs missed in the meantime
+        next_run_time = next_fire_time(trigger, run_time, datetime.now())
+        heapq.heappush(queue, (next_run_time, job_id, job, trigger, grace_time))
 
 def signal_handler(sig, frame):
     """Handle shutdown signals"""
-    global scheduler
     logger.info("Shutting down...")
-    if scheduler:
-        scheduler.shutdown()
-    sys.exit(0)
+    shutdown_event.set()
 
 def main():
     """Main entry point for the application"""
-    global scheduler
     logger.info("Starting Transit Calendar application")
     
     try:
@@ -151,26 +188,21 @@ def main():
         calendar_service.initialize()
 
         # Set up the scheduler
-        scheduler = setup_scheduler()
+        jobs = setup_scheduler()
         
         # Set up signal handlers for graceful shutdown
         signal.signal(signal.SIGINT, signal_handler)
         signal.signal(signal.SIGTERM, signal_handler)
         
-        # Start the scheduler
-        scheduler.start()
-        
         # Run initial check
         logger.info("Running initial calendar check")
         check_for_calendar_updates()
         
-        # Keep the main thread alive
-        while True:
-            time.sleep(1)
+        # Run scheduled jobs on the main thread until a shutdown signal arrives
+        run_scheduler(jobs)
+        logger.info("Application shutting down...")
     except (KeyboardInterrupt, SystemExit):
         logger.info("Application shutting down...")
-        if scheduler:
-            scheduler.shutdown()
     except Exception as e:
         logger.error(f"Application error: {str(e)}")
         sys.exit(1)
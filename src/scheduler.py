@@ -1,13 +1,18 @@
-import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Set, List, Optional, Tuple
+from typing import Dict, Set, List, Optional, Tuple
 
 import config
 from loguru import logger
 
 import database as db
 from calendar_service import calendar_service
-from transit_service import are_locations_similar, calculate_transit_time
+from transit_service import are_locations_similar, calculate_transit_time, geocode_addresses, is_home_location
+from utils import generate_unique_id
+
+# Transit events are blocked out in 15 minute increments
+TRANSIT_ROUNDING_SECONDS = 900
+TRANSIT_ROUNDING = timedelta(seconds=TRANSIT_ROUNDING_SECONDS)
 
 
 def check_for_calendar_updates():
@@ -19,19 +24,17 @@ def check_for_calendar_updates():
 
         # Process all events with locations
         dates_to_process = set()
-        current_event_ids = set()
+        current_event_ids = {event["id"] for event in current_events}
+        located_events = [event for event in current_events if event.get("location")]
 
         # Save events and collect dates to process for changed/new events
-        for event in current_events:
-            current_event_ids.add(event["id"])
-            if event.get("location"):
-                date_str, event_changed = db.save_event(event)
-                # Only add to processing if event details have changed
-                if event_changed:
-                    dates_to_process.add(date_str)
-                    logger.info(f"Event '{event.get('title')}' on {date_str} has changed, will process")
-                else:
-                    logger.debug(f"Event '{event.get('title')}' on {date_str} unchanged, skipping")
+        for event, (date_str, event_changed) in zip(located_events, db.save_events(located_events)):
+            # Only add to processing if event details have changed
+            if event_changed:
+                dates_to_process.add(date_str)
+                logger.info(f"Event '{event.get('title')}' on {date_str} has changed, will process")
+            else:
+                logger.debug(f"Event '{event.get('title')}' on {date_str} unchanged, skipping")
 
         # Check for deleted events
         deleted_event_dates = db.detect_deleted_events(current_event_ids)
@@ -39,9 +42,9 @@ def check_for_calendar_updates():
             dates_to_process.add(date_str)
             logger.info(f"Detected deleted events on {date_str}, will process")
 
-        # Process each date
-        for date_str in dates_to_process:
-            process_date(date_str)
+        # Process the changed dates, creating their transit events together
+        if dates_to_process:
+            process_dates(sorted(dates_to_process))
 
         logger.info(f"Calendar update check complete, processed {len(dates_to_process)} dates")
     except Exception as e:
@@ -67,11 +70,8 @@ def _clear_existing_transit_events(date_str: str) -> None:
 
 def _get_events_for_date(date_str: str) -> List:
     """Get and validate events for a specific date"""
-    events = db.get_events_for_date(date_str)
-    
-    # Filter events with locations and sort by start time
-    events_with_location = [e for e in events if e.location]
-    events_with_location.sort(key=lambda ev: ev.start_time)
+    # Events with locations, sorted by start time
+    events_with_location = db.get_located_event_rows_for_date(date_str)
     
     if not events_with_location:
         logger.info(f"No events with locations found for date: {date_str}")
@@ -84,27 +84,33 @@ def _get_events_for_date(date_str: str) -> List:
 def _calculate_and_validate_transit_duration(origin: str, destination: str, arrival_time) -> Optional[int]:
     """Calculate transit duration and validate against limits"""
     
-    logger.info(f"Calculating transit time from '{origin}' to '{destination}'")
+    logger.debug("Calculating transit time from '{}' to '{}'", origin, destination)
     
     transit_duration = calculate_transit_time(origin, destination, arrival_time)
-    logger.info(f"Transit duration result: {transit_duration} seconds ({transit_duration/3600 if transit_duration else 'None'} hours)")
+    logger.debug("Transit duration result: {} seconds", transit_duration)
     
     if not transit_duration:
         logger.info("Skipping transit event - no transit duration calculated (API error or no route)")
         return None
     
     if transit_duration > config.MAX_TRANSIT_TIME_HOURS * 3600:
-        logger.info(f"Skipping transit event - duration {transit_duration}s ({transit_duration/3600:.1f}h) exceeds {config.MAX_TRANSIT_TIME_HOURS}h limit")
+        logger.info("Skipping transit event - duration {}s ({:.1f}h) exceeds {}h limit",
+                    transit_duration, transit_duration / 3600, config.MAX_TRANSIT_TIME_HOURS)
         return None
     
-    logger.info(f"Transit duration {transit_duration}s is within {config.MAX_TRANSIT_TIME_HOURS}h limit")
+    logger.debug("Transit duration {}s is within {}h limit", transit_duration, config.MAX_TRANSIT_TIME_HOURS)
     return transit_duration
 
 
+def _round_up_transit_duration(transit_duration: int) -> timedelta:
+    """Round a transit duration in seconds up to the next 15 minutes"""
+    return -(-transit_duration // TRANSIT_ROUNDING_SECONDS) * TRANSIT_ROUNDING
+
+
 def _create_transit_event_data(title: str, origin: str, destination: str, start_time, end_time) -> dict:
     """Create transit event data dictionary"""
     return {
-        "id": str(uuid.uuid4()),
+        "id": generate_unique_id(),
         "title": title,
         "origin": origin,
         "destination": destination,
@@ -113,72 +119,98 @@ def _create_transit_event_data(title: str, origin: str, destination: str, start_
     }
 
 
-def _save_and_create_transit_event(transit_event: dict) -> None:
-    """Save transit event to database and create on calendar"""
-    db.save_transit_event(transit_event)
-    calendar_service.create_transit_event(transit_event)
+def _save_and_create_transit_events(transit_events_by_date: Dict[str, List[dict]]) -> None:
+    """Save transit events to database and create them on calendar in one batch
 
+    If the batch can't be saved, each date is saved on its own so one bad
+    date doesn't cost the others their transit events.
 
-def _process_outbound_transit(last_location: str, last_event_name: str, current_event, current_title: str) -> None:
-    """Process transit from previous location to current event location"""
-    current_location = current_event.location
-    transit_end_time = current_event.start_time
-    
-    if are_locations_similar(last_location, current_location):
+    Args:
+        transit_events_by_date (Dict[str, List[dict]]): Transit events to create, by date
+    """
+    try:
+        db.save_transit_events([
+            transit_event for transit_events in transit_events_by_date.values() for transit_event in transit_events
+        ])
+        saved_dates = list(transit_events_by_date)
+    except Exception as e:
+        # The batch is saved in one transaction, so nothing was saved
+        logger.warning(f"Error saving transit events in one batch, saving each date separately: {str(e)}")
+        saved_dates = []
+        for date_str, transit_events in transit_events_by_date.items():
+            try:
+                db.save_transit_events(transit_events)
+                saved_dates.append(date_str)
+            except Exception as e:
+                logger.error(f"Error saving transit events for date {date_str}: {str(e)}")
+
+    transit_events = [
+        transit_event for date_str in saved_dates for transit_event in transit_events_by_date[date_str]
+    ]
+    try:
+        results = calendar_service.create_transit_events(transit_events)
+    except Exception as e:
+        logger.error(f"Error creating transit events for {', '.join(saved_dates)}: {str(e)}")
         return
-    
-    transit_duration = _calculate_and_validate_transit_duration(
-        last_location, current_location, transit_end_time
-    )
-    
+
+    # Results are in batch order, so each date's are a consecutive run
+    position = 0
+    for date_str in saved_dates:
+        count = len(transit_events_by_date[date_str])
+        if all(results[position:position + count]):
+            logger.info(f"Completed processing transit events for date: {date_str}")
+        else:
+            logger.error(f"Failed to create some transit events for date: {date_str}")
+        position += count
+
+
+def _calculate_leg_durations(legs: List[Tuple[str, str, datetime]]) -> List[Optional[int]]:
+    """Calculate and validate the transit duration of each (origin, destination, time) leg
+
+    Legs are independent and each is mostly waiting on the directions API, so
+    they're calculated concurrently, with results returned in leg order.
+    """
+    if len(legs) <= 1:
+        return [_calculate_and_validate_transit_duration(*leg) for leg in legs]
+
+    with ThreadPoolExecutor(max_workers=min(len(legs), config.HERE_MAX_WORKERS)) as executor:
+        return list(executor.map(lambda leg: _calculate_and_validate_transit_duration(*leg), legs))
+
+
+def _process_outbound_transit(last_location: str, last_event_name: str, current_event, current_title: str, transit_duration: Optional[int]) -> Optional[dict]:
+    """Process transit from previous location to current event location"""
     if not transit_duration:
-        return
+        return None
     
-    # Round duration to nearest 15 minutes (900 seconds)
-    rounded_transit_duration = (transit_duration // 900 + 1) * 900
-    transit_start_time = transit_end_time - timedelta(seconds=rounded_transit_duration)
+    transit_end_time = current_event.start_time
+    transit_start_time = transit_end_time - _round_up_transit_duration(transit_duration)
 
-    # Create and save transit event
-    transit_event = _create_transit_event_data(
+    # Create transit event
+    return _create_transit_event_data(
         title=f"{last_event_name} > {current_title}",
         origin=last_location,
-        destination=current_location,
+        destination=current_event.location,
         start_time=transit_start_time,
         end_time=transit_end_time
     )
-    
-    _save_and_create_transit_event(transit_event)
 
 
-def _process_return_home_transit(current_event, current_title: str) -> None:
+def _process_return_home_transit(current_event, current_title: str, transit_duration: Optional[int]) -> Optional[dict]:
     """Process transit from current event location back to home"""
-    current_location = current_event.location
-    home_transit_start_time = current_event.end_time
-    
-    if are_locations_similar(current_location, config.HOME_ADDRESS):
-        return
-    
-    home_transit_duration = _calculate_and_validate_transit_duration(
-        current_location, config.HOME_ADDRESS, home_transit_start_time
-    )
-    
-    if not home_transit_duration:
-        return
+    if not transit_duration:
+        return None
     
-    # Round duration to nearest 15 minutes
-    rounded_home_transit_duration = (home_transit_duration // 900 + 1) * 900
-    home_transit_end_time = home_transit_start_time + timedelta(seconds=rounded_home_transit_duration)
+    home_transit_start_time = current_event.end_time
+    home_transit_end_time = home_transit_start_time + _round_up_transit_duration(transit_duration)
 
-    # Create and save transit event
-    transit_event = _create_transit_event_data(
+    # Create transit event
+    return _create_transit_event_data(
         title=f"{current_title} > Home",
-        origin=current_location,
+        origin=current_event.location,
         destination=config.HOME_ADDRESS,
         start_time=home_transit_start_time,
         end_time=home_transit_end_time
     )
-    
-    _save_and_create_transit_event(transit_event)
 
 
 def process_date(date):
@@ -192,39 +224,113 @@ def process_date(date):
     else:
         date_str = date
 
+    process_dates([date_str])
+
+
+def process_dates(date_strs: List[str]) -> None:
+    """Process several dates, creating all of their transit events in one batch
+
+    A date's existing transit events are only deleted once its new ones have
+    been worked out, so a date that fails to plan keeps the ones it has.
+
+    Args:
+        date_strs (List[str]): Dates to process in YYYY-MM-DD format
+    """
+    # Dates are independent, so prepare them concurrently; each is mostly
+    # waiting on the calendar server and the directions API
+    if len(date_strs) > 1:
+        with ThreadPoolExecutor(max_workers=min(len(date_strs), config.CALDAV_MAX_WORKERS)) as executor:
+            prepared = dict(zip(date_strs, executor.map(_prepare_date, date_strs)))
+    else:
+        prepared = {date_str: _prepare_date(date_str) for date_str in date_strs}
+
+    # Save and create the prepared dates' transit events in one batch
+    _save_and_create_transit_events({
+        date_str: transit_events for date_str, transit_events in prepared.items() if transit_events is not None
+    })
+
+
+def _prepare_date(date_str: str) -> Optional[List[dict]]:
+    """Work out a date's transit events, then clear its existing ones
+
+    Args:
+        date_str (str): Date in YYYY-MM-DD format
+
+    Returns:
+        Optional[List[dict]]: Transit events to create for the date, or None
+            if planning failed and the existing ones were kept
+    """
+    transit_events = _plan_transit_events_for_date(date_str)
+    if transit_events is not None:
+        _clear_existing_transit_events(date_str)
+    return transit_events
+
+
+def _plan_transit_events_for_date(date_str: str) -> Optional[List[dict]]:
+    """Work out the transit events for a date
+
+    Args:
+        date_str (str): Date in YYYY-MM-DD format
+
+    Returns:
+        Optional[List[dict]]: Transit events to create for the date, or None on error
+    """
     logger.info(f"Processing transit events for date: {date_str}")
 
     try:
-        # Clear existing transit events
-        _clear_existing_transit_events(date_str)
-        
         # Get events for the date
         events_with_location = _get_events_for_date(date_str)
         if not events_with_location:
-            return
+            return []
+
+        # Geocode each of the date's locations once, up front and concurrently
+        geocode_addresses([config.HOME_ADDRESS] + [event.location for event in events_with_location])
 
-        # Process events to create transit events
+        # Work out the legs of the day, skipping those that stay in one place
         last_location = config.HOME_ADDRESS
         last_event_name = "Home"
+        outbound_legs = []
+        return_home_leg = None
 
         for i, current_event in enumerate(events_with_location):
             current_location = current_event.location
-            current_title = "Home" if are_locations_similar(config.HOME_ADDRESS, current_location) else current_event.title
+            is_home = is_home_location(current_location)
+            current_title = "Home" if is_home else current_event.title
+
+            # The first event is reached from home, which we've just compared against
+            same_location = is_home if i == 0 else are_locations_similar(last_location, current_location)
             
-            # Process outbound transit (to the event)
-            _process_outbound_transit(last_location, last_event_name, current_event, current_title)
+            # Outbound transit (to the event)
+            if not same_location:
+                outbound_legs.append((last_location, last_event_name, current_event, current_title))
 
             # Update tracking variables
             last_location = current_location
             last_event_name = current_title
 
-            # Process return home transit if this is the last event of the day
-            if i == len(events_with_location) - 1:
-                _process_return_home_transit(current_event, current_title)
-
-        logger.info(f"Completed processing transit events for date: {date_str}")
+            # Return home transit if this is the last event of the day
+            if i == len(events_with_location) - 1 and not is_home:
+                return_home_leg = (current_event, current_title)
+
+        # Look up every leg's transit time at once
+        legs = [(origin, current_event.location, current_event.start_time)
+                for origin, _, current_event, _ in outbound_legs]
+        if return_home_leg:
+            legs.append((return_home_leg[0].location, config.HOME_ADDRESS, return_home_leg[0].end_time))
+        durations = _calculate_leg_durations(legs)
+
+        # Create transit events in the order of the day
+        transit_events = [
+            _process_outbound_transit(*outbound_leg, transit_duration)
+            for outbound_leg, transit_duration in zip(outbound_legs, durations)
+        ]
+        if return_home_leg:
+            transit_events.append(_process_return_home_transit(*return_home_leg, durations[-1]))
+
+        return [transit_event for transit_event in transit_events if transit_event]
     except Exception as e:
         logger.error(f"Error processing date {date_str}: {str(e)}")
+        return None
 
 
 def process_daily_update():
@@ -252,11 +358,10 @@ def reset_all_transit_events():
     try:
         now = datetime.now()
 
-        for i in range(config.LOOK_FORWARD_DAYS + 1):
-            target_date = now + timedelta(days=i)
-            target_date_str = target_date.strftime('%Y-%m-%d')
-
-            process_date(target_date_str)
+        process_dates([
+            (now + timedelta(days=i)).strftime('%Y-%m-%d')
+            for i in range(config.LOOK_FORWARD_DAYS + 1)
+        ])
 
         logger.info("Reset of all transit events complete")
     except Exception as e:
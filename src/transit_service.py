@@ -1,10 +1,118 @@
 import re
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
 
 import config
+import database as db
 import requests
 from loguru import logger
 from datetime import datetime
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
+# HERE transportMode for each DEFAULT_TRANSIT_MODE; public transit needs none
+TRANSPORT_MODES = {
+    'transit': None,
+    'driving': 'car',
+    'walking': 'pedestrian',
+    'cycling': 'bicycle',
+}
+
+# The configured mode can't change at runtime, so resolve it once
+TRANSPORT_MODE = TRANSPORT_MODES.get(config.DEFAULT_TRANSIT_MODE)
+
+# Seconds to wait on the HERE API before giving up on a request
+HERE_API_TIMEOUT = 10
+
+# Keep-alive session shared by all HERE API calls, so requests to the geocoding
+# and routing hosts reuse their TCP/TLS connections. The pool holds enough
+# idle connections for the concurrent geocoding and routing workers.
+here_session = requests.Session()
+here_session.mount('https://', HTTPAdapter(
+    pool_connections=2,
+    pool_maxsize=max(16, 2 * config.HERE_MAX_WORKERS),
+    max_retries=Retry(total=3, backoff_factor=0.3)
+))
+
+# Caps concurrent HERE API requests across all threads, however many pools
+# (dates, geocoding, transit legs) are running at once
+here_request_slots = threading.BoundedSemaphore(config.HERE_MAX_WORKERS)
+
+# Transit durations keyed by (origin, destination, arrival hour), stored with
+# the monotonic time they were fetched so repeated trips skip the API
+TRANSIT_TIME_CACHE_TTL = 3600
+TRANSIT_TIME_CACHE_SIZE = 4096
+transit_time_cache = {}
+
+# Coordinates of geocoded addresses, in front of the copy kept in the database
+GEOCODE_CACHE_SIZE = 1024
+geocode_cache = {}
+
+# Requests currently in flight, so concurrent lookups of the same thing (e.g.
+# the home address, from every date being planned) share a single API call
+in_flight_requests = {}
+in_flight_lock = threading.Lock()
+
+# Patterns compiled once at import since address helpers run for every event pair
+NON_ALPHANUMERIC_PATTERN = re.compile(r'[^a-z0-9]')
+
+# Deletes every ASCII character other than a-z and 0-9 in a single pass
+NON_ALPHANUMERIC_TABLE = {
+    code: None for code in range(128)
+    if not ('a' <= chr(code) <= 'z' or '0' <= chr(code) <= '9')
+}
+
+# Common street abbreviations and their expansions
+ABBREVIATION_PATTERNS = [
+    (re.compile(pattern), replacement) for pattern, replacement in {
+        r'\bst\b': 'street',
+        r'\bave\b': 'avenue',
+        r'\bblvd\b': 'boulevard',
+        r'\bdr\b': 'drive',
+        r'\bct\b': 'court',
+        r'\brd\b': 'road',
+        r'\bln\b': 'lane',
+        r'\bapt\b': 'apartment',
+        r'\bpkwy\b': 'parkway',
+        r'\bpl\b': 'place',
+        r'\btrl\b': 'trail',
+        r'\bcir\b': 'circle',
+        r'\bbldg\b': 'building',
+        r'\bfwy\b': 'freeway'
+    }.items()
+]
+
+def coalesce_request(key, request):
+    """Make a request, sharing its result with concurrent calls for the same key
+    
+    Args:
+        key (tuple): Identifies the request
+        request (callable): Makes the request and returns its result
+        
+    Returns:
+        The result of the request
+    """
+    with in_flight_lock:
+        future = in_flight_requests.get(key)
+        is_owner = future is None
+        if is_owner:
+            future = in_flight_requests[key] = Future()
+
+    if not is_owner:
+        return future.result()
+
+    try:
+        result = request()
+        future.set_result(result)
+        return result
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    finally:
+        with in_flight_lock:
+            del in_flight_requests[key]
 
 def calculate_transit_time(origin, destination, arrival_time):
     """Calculate transit time between two locations using HERE Transit API
@@ -21,6 +129,16 @@ def calculate_transit_time(origin, destination, arrival_time):
         # Normalize address format
         origin = normalize_address(origin)
         destination = normalize_address(destination)
+
+        # Reuse the duration of the same trip arriving within the same hour
+        cache_key = (
+            origin.lower(),
+            destination.lower(),
+            arrival_time.replace(minute=0, second=0, microsecond=0).isoformat()
+        )
+        cached = transit_time_cache.get(cache_key)
+        if cached and time.monotonic() - cached[1] < TRANSIT_TIME_CACHE_TTL:
+            return cached[0]
         
         # Convert addresses to coordinates
         origin_coords = geocode_address(origin)
@@ -44,18 +162,12 @@ def calculate_transit_time(origin, destination, arrival_time):
         }
         
         # Add transit mode preference if specified
-        if config.DEFAULT_TRANSIT_MODE == 'transit':
-            # For public transit, no additional parameters needed
-            pass
-        elif config.DEFAULT_TRANSIT_MODE == 'driving':
-            params['transportMode'] = 'car'
-        elif config.DEFAULT_TRANSIT_MODE == 'walking':
-            params['transportMode'] = 'pedestrian'
-        elif config.DEFAULT_TRANSIT_MODE == 'cycling':
-            params['transportMode'] = 'bicycle'
+        if TRANSPORT_MODE:
+            params['transportMode'] = TRANSPORT_MODE
         
         # Make API request
-        response = requests.get(url, params=params)
+        with here_request_slots:
+            response = here_session.get(url, params=params, timeout=HERE_API_TIMEOUT)
         
         if response.status_code == 200:
             data = response.json()
@@ -71,6 +183,10 @@ def calculate_transit_time(origin, destination, arrival_time):
                         if 'travelSummary' in section:
                             total_duration += section['travelSummary'].get('duration', 0)
                     
+                    if len(transit_time_cache) >= TRANSIT_TIME_CACHE_SIZE:
+                        transit_time_cache.clear()
+                    transit_time_cache[cache_key] = (total_duration, time.monotonic())
+
                     # Return duration in seconds
                     return total_duration
             
@@ -84,6 +200,7 @@ def calculate_transit_time(origin, destination, arrival_time):
         logger.error(f"Error calculating transit time with HERE Transit API: {str(e)}")
         return None
 
+@lru_cache(maxsize=1024)
 def normalize_address(address):
     """Normalize address format for geocoding
     
@@ -96,23 +213,27 @@ def normalize_address(address):
     if not address:
         return ""
         
+    # These are simple enough that str methods beat the regex engine
+    
     # Replace newlines with commas
-    address = re.sub(r'\r?\n', ', ', address)
+    address = address.replace('\r\n', ', ').replace('\n', ', ')
     
-    # Replace multiple spaces with single space
-    address = re.sub(r'\s+', ' ', address)
+    # Replace runs of whitespace with single space
+    address = ' '.join(address.split())
     
     # Replace multiple commas with a single comma
-    address = re.sub(r',+', ',', address)
+    while ',,' in address:
+        address = address.replace(',,', ',')
     
     # Replace comma+space with just comma
-    address = re.sub(r',\s+', ',', address)
+    address = address.replace(', ', ',')
     
     # Remove leading/trailing commas and spaces
     address = address.strip(' ,')
     
     return address
 
+@lru_cache(maxsize=1024)
 def get_apple_maps_url(origin, destination):
     """Create an Apple Maps URL for directions
     
@@ -139,6 +260,73 @@ def get_apple_maps_url(origin, destination):
 def geocode_address(address):
     """Geocode an address to coordinates using HERE Geocoding API
     
+    Args:
+        address (str): Address to geocode
+        
+    Returns:
+        list: [longitude, latitude] or None if geocoding failed
+    """
+    coordinates = geocode_cache.get(address)
+    if coordinates:
+        return coordinates
+
+    coordinates = coalesce_request(('geocode', address), lambda: lookup_geocode(address))
+
+    # Failures aren't cached so they're retried next time
+    if coordinates:
+        if len(geocode_cache) >= GEOCODE_CACHE_SIZE:
+            geocode_cache.clear()
+        geocode_cache[address] = coordinates
+
+    return coordinates
+
+def geocode_addresses(addresses):
+    """Geocode several addresses concurrently, one request per unique address
+    
+    Results are cached like any other geocoding, so later transit time
+    calculations for these addresses don't wait on the geocoding API.
+    
+    Args:
+        addresses (iterable): Addresses in any format
+        
+    Returns:
+        dict: Normalized address to [longitude, latitude], or None if geocoding failed
+    """
+    unique_addresses = {normalize_address(address) for address in addresses if address}
+    unique_addresses.discard("")
+    if not unique_addresses:
+        return {}
+
+    # Only addresses we haven't already geocoded need a worker
+    missing = [address for address in unique_addresses if address not in geocode_cache]
+    if len(missing) > 1:
+        with ThreadPoolExecutor(max_workers=min(len(missing), config.HERE_MAX_WORKERS)) as executor:
+            list(executor.map(geocode_address, missing))
+
+    return {address: geocode_address(address) for address in unique_addresses}
+
+def lookup_geocode(address):
+    """Look up an address in the database, geocoding and storing it if missing
+    
+    Args:
+        address (str): Address to geocode
+        
+    Returns:
+        list: [longitude, latitude] or None if geocoding failed
+    """
+    coordinates = db.get_geocoded_address(address)
+    if coordinates:
+        return coordinates
+
+    coordinates = request_geocode(address)
+    if coordinates:
+        db.save_geocoded_address(address, coordinates)
+
+    return coordinates
+
+def request_geocode(address):
+    """Request the coordinates of an address from the HERE Geocoding API
+    
     Args:
         address (str): Address to geocode
         
@@ -155,7 +343,8 @@ def geocode_address(address):
         }
         
         # Make API request
-        response = requests.get(url, params=params)
+        with here_request_slots:
+            response = here_session.get(url, params=params, timeout=HERE_API_TIMEOUT)
         
         if response.status_code == 200:
             data = response.json()
@@ -176,6 +365,7 @@ def geocode_address(address):
         logger.error(f"Error geocoding address '{address}': {str(e)}")
         return None
 
+@lru_cache(maxsize=2048)
 def are_locations_similar(location1, location2):
     """Check if two locations are similar
     
@@ -189,11 +379,16 @@ def are_locations_similar(location1, location2):
     if not location1 or not location2:
         return False
     
+    # The same location, e.g. consecutive events at one place, needs no standardizing
+    if location1 == location2:
+        return True
+    
     standardized1 = standardize_location(location1)
     standardized2 = standardize_location(location2)
     
     return standardized1 in standardized2 or standardized2 in standardized1
 
+@lru_cache(maxsize=2048)
 def standardize_location(location):
     """Standardize a location string for comparison
     
@@ -209,33 +404,37 @@ def standardize_location(location):
     # Convert to lowercase
     result = location.lower()
     
-    # Remove whitespace
-    result = re.sub(r'\s+', '', result)
+    # Standardize common abbreviations while word boundaries still exist
+    for pattern, replacement in ABBREVIATION_PATTERNS:
+        result = pattern.sub(replacement, result)
     
-    # Remove non-alphanumeric characters
-    result = re.sub(r'[^a-z0-9]', '', result)
+    # Remove whitespace and non-alphanumeric characters
+    result = result.translate(NON_ALPHANUMERIC_TABLE)
     
-    # Standardize common abbreviations
-    replacements = {
-        r'\bst\b': 'street',
-        r'\bave\b': 'avenue',
-        r'\bblvd\b': 'boulevard',
-        r'\bdr\b': 'drive',
-        r'\bct\b': 'court',
-        r'\brd\b': 'road',
-        r'\bln\b': 'lane',
-        r'\bapt\b': 'apartment',
-        r'\bsuite\b': 'suite',
-        r'\bpkwy\b': 'parkway',
-        r'\bpl\b': 'place',
-        r'\btrl\b': 'trail',
-        r'\bcir\b': 'circle',
-        r'\bway\b': 'way',
-        r'\bbldg\b': 'building',
-        r'\bfwy\b': 'freeway'
-    }
+    # The table only covers ASCII, so strip anything else the slow way
+    if not result.isascii():
+        result = NON_ALPHANUMERIC_PATTERN.sub('', result)
+    
+    return result
+
+# The home address can't change at runtime, so standardize it once
+HOME_ADDRESS_STANDARDIZED = standardize_location(config.HOME_ADDRESS) if config.HOME_ADDRESS else ""
+
+def is_home_location(location):
+    """Check if a location is similar to the home address
+    
+    Args:
+        location (str): Location string
+        
+    Returns:
+        bool: True if the location is home, False otherwise
+    """
+    if not location or not config.HOME_ADDRESS:
+        return False
+    
+    if location == config.HOME_ADDRESS:
+        return True
     
-    for pattern, replacement in replacements.items():
-        result = re.sub(pattern, replacement, result)
+    standardized = standardize_location(location)
     
-    return result
\ No newline at end of file
+    return HOME_ADDRESS_STANDARDIZED in standardized or standardized in HOME_ADDRESS_STANDARDIZED
\ No newline at end of file
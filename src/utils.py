@@ -1,4 +1,4 @@
-import uuid
+import os
 from datetime import timedelta
 
 
@@ -7,9 +7,10 @@ def generate_unique_id():
     """Generate a unique ID
     
     Returns:
-        str: Unique ID
+        str: Unique ID, 32 random hex digits
     """
-    return str(uuid.uuid4())
+    # IDs only need to be unique, not RFC 4122 UUIDs
+    return os.urandom(16).hex()
 
 def round_up_to_interval(date, interval_minutes):
     """Round a datetime up to the nearest interval
@@ -21,10 +22,12 @@ def round_up_to_interval(date, interval_minutes):
     Returns:
         datetime: Rounded date
     """
-    minutes = (date.hour * 60 + date.minute)
-    remainder = minutes % interval_minutes
+    minutes = date.hour * 60 + date.minute
+    
+    # Minutes to the next interval boundary, 0 if already on one
+    remainder = -minutes % interval_minutes
     
     if remainder == 0:
         return date
     
-    return date + timedelta(minutes=interval_minutes - remainder)
+    return date + timedelta(minutes=remainder)
\ No newline at end of file
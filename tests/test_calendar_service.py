@@ -0,0 +1,277 @@
+import os
+import sys
+import tempfile
+import unittest
+from datetime import datetime, timezone
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+# The app's modules import each other flat from src/, and importing the
+# database module creates the SQLite engine, so point it somewhere disposable
+os.environ.setdefault("DB_PATH", os.path.join(tempfile.mkdtemp(), "transit-calendar.sqlite"))
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+import caldav
+import pytz
+from caldav.elements import cdav
+
+from calendar_service import CalendarService
+
+CALENDAR_URL = "https://caldav.example.com/calendars/user/source/"
+
+EVENT_ICAL = (
+    "BEGIN:VCALENDAR\r\n"
+    "VERSION:2.0\r\n"
+    "BEGIN:VEVENT\r\n"
+    "UID:event1\r\n"
+    "SUMMARY:Dentist\r\n"
+    "LOCATION:1 Tooth Lane\r\n"
+    "DTSTART:20260110T090000Z\r\n"
+    "DTEND:20260110T100000Z\r\n"
+    "END:VEVENT\r\n"
+    "END:VCALENDAR\r\n"
+)
+
+
+class RefreshParseCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.service = CalendarService()
+        client = caldav.DAVClient(url=CALENDAR_URL)
+        self.service.source_calendar = caldav.Calendar(client=client, url=CALENDAR_URL)
+        self.event_url = str(self.service.source_calendar.url.join("event1.ics"))
+
+    def test_changed_event_is_downloaded_with_multiget(self):
+        # The cached copy has an old ETag, so the event must be re-downloaded
+        self.service._parse_cache = {(self.event_url, '"old"'): []}
+
+        response = MagicMock()
+        response.expand_simple_props.return_value = {
+            "/calendars/user/source/event1.ics": {cdav.CalendarData.tag: EVENT_ICAL}
+        }
+
+        with patch.object(self.service, "_get_etags", return_value={self.event_url: '"new"'}), \
+                patch.object(caldav.Calendar, "_query", return_value=response) as query, \
+                patch.object(self.service, "safe_date_search", side_effect=AssertionError("fell back to a full download")):
+            events = self.service.fetch_events(datetime(2026, 1, 1), datetime(2026, 1, 31))
+
+        query.assert_called_once()
+        self.assertEqual([event["id"] for event in events], ["event1"])
+        self.assertEqual(events[0]["location"], "1 Tooth Lane")
+        self.assertIn((self.event_url, '"new"'), self.service._parse_cache)
+
+    def test_event_without_etag_is_always_downloaded(self):
+        # A cached parse without an ETag can't be validated, so it's stale
+        self.service._parse_cache = {(self.event_url, None): []}
+
+        response = MagicMock()
+        response.expand_simple_props.return_value = {
+            "/calendars/user/source/event1.ics": {cdav.CalendarData.tag: EVENT_ICAL}
+        }
+
+        with patch.object(self.service, "_get_etags", return_value={self.event_url: None}), \
+                patch.object(caldav.Calendar, "_query", return_value=response) as query:
+            events = self.service.fetch_events(datetime(2026, 1, 1), datetime(2026, 1, 31))
+
+        query.assert_called_once()
+        self.assertEqual([event["id"] for event in events], ["event1"])
+
+
+
+def recurring_ical(*vevents):
+    body = "".join(
+        "BEGIN:VEVENT\r\n" + "".join(f"{line}\r\n" for line in lines) + "END:VEVENT\r\n"
+        for lines in vevents
+    )
+    return "BEGIN:VCALENDAR\r\nVERSION:2.0\r\n" + body + "END:VCALENDAR\r\n"
+
+
+DAILY_SERIES = [
+    "UID:standup",
+    "SUMMARY:Standup",
+    "LOCATION:1 Office Park",
+    "DTSTART:20260105T090000Z",
+    "DTEND:20260105T093000Z",
+    "RRULE:FREQ=DAILY;COUNT=5",
+]
+
+
+class RecurringEventTest(unittest.TestCase):
+    def setUp(self):
+        self.service = CalendarService()
+        client = caldav.DAVClient(url=CALENDAR_URL)
+        self.service.source_calendar = caldav.Calendar(client=client, url=CALENDAR_URL)
+        self.event_url = str(self.service.source_calendar.url.join("standup.ics"))
+
+    def fetch(self, ical, start_date, end_date):
+        response = MagicMock()
+        response.expand_simple_props.return_value = {
+            "/calendars/user/source/standup.ics": {cdav.CalendarData.tag: ical}
+        }
+
+        with patch.object(self.service, "_get_etags", return_value={self.event_url: '"1"'}), \
+                patch.object(caldav.Calendar, "_query", return_value=response):
+            events = self.service.fetch_events(start_date, end_date)
+
+        return {event["id"]: event for event in events}
+
+    def test_exdate_removes_instance(self):
+        ical = recurring_ical(DAILY_SERIES + ["EXDATE:20260107T090000Z"])
+
+        events = self.fetch(ical, datetime(2026, 1, 1), datetime(2026, 1, 31))
+
+        self.assertEqual(sorted(events), [
+            "standup_20260105T090000",
+            "standup_20260106T090000",
+            "standup_20260108T090000",
+            "standup_20260109T090000",
+        ])
+
+    def test_recurrence_id_overrides_replace_instances(self):
+        ical = recurring_ical(
+            DAILY_SERIES,
+            [
+                "UID:standup",
+                "SUMMARY:Standup",
+                "LOCATION:2 Client Street",
+                "RECURRENCE-ID:20260106T090000Z",
+                "DTSTART:20260106T140000Z",
+                "DTEND:20260106T143000Z",
+            ],
+            [
+                # Moved out of the window entirely
+                "UID:standup",
+                "SUMMARY:Standup",
+                "LOCATION:1 Office Park",
+                "RECURRENCE-ID:20260108T090000Z",
+                "DTSTART:20260220T090000Z",
+                "DTEND:20260220T093000Z",
+            ],
+        )
+
+        events = self.fetch(ical, datetime(2026, 1, 1), datetime(2026, 1, 31))
+
+        self.assertEqual(sorted(events), [
+            "standup_20260105T090000",
+            "standup_20260106T090000",
+            "standup_20260107T090000",
+            "standup_20260109T090000",
+        ])
+        moved = events["standup_20260106T090000"]
+        self.assertEqual(moved["startTime"], "2026-01-06T14:00:00+00:00")
+        self.assertEqual(moved["location"], "2 Client Street")
+
+    def test_weekly_series_keeps_local_time_across_dst(self):
+        # Clocks in New York go forward on 2026-03-08
+        ical = recurring_ical([
+            "UID:standup",
+            "SUMMARY:Standup",
+            "LOCATION:1 Office Park",
+            "DTSTART;TZID=America/New_York:20260301T090000",
+            "DTEND;TZID=America/New_York:20260301T093000",
+            "RRULE:FREQ=WEEKLY;COUNT=3",
+        ])
+
+        events = self.fetch(ical, datetime(2026, 2, 1), datetime(2026, 3, 31))
+
+        self.assertEqual(
+            [(event["startTime"], event["endTime"]) for _, event in sorted(events.items())],
+            [
+                ("2026-03-01T09:00:00-05:00", "2026-03-01T09:30:00-05:00"),
+                ("2026-03-08T09:00:00-04:00", "2026-03-08T09:30:00-04:00"),
+                ("2026-03-15T09:00:00-04:00", "2026-03-15T09:30:00-04:00"),
+            ]
+        )
+
+    def test_floating_series(self):
+        ical = recurring_ical([
+            "UID:standup",
+            "SUMMARY:Standup",
+            "LOCATION:1 Office Park",
+            "DTSTART:20260105T090000",
+            "DTEND:20260105T093000",
+            "RRULE:FREQ=DAILY;COUNT=3",
+        ])
+
+        events = self.fetch(ical, datetime(2026, 1, 1), datetime(2026, 1, 31))
+
+        self.assertEqual(
+            [event["startTime"] for _, event in sorted(events.items())],
+            [
+                "2026-01-05T09:00:00+00:00",
+                "2026-01-06T09:00:00+00:00",
+                "2026-01-07T09:00:00+00:00",
+            ]
+        )
+
+
+def transit_ical(uid, dtstart, dtend):
+    return (
+        "BEGIN:VCALENDAR\r\n"
+        "VERSION:2.0\r\n"
+        "BEGIN:VEVENT\r\n"
+        f"UID:{uid}\r\n"
+        "SUMMARY:Transit\r\n"
+        f"DTSTART:{dtstart}\r\n"
+        f"DTEND:{dtend}\r\n"
+        "END:VEVENT\r\n"
+        "END:VCALENDAR\r\n"
+    )
+
+
+class DeleteTransitEventsForDateTest(unittest.TestCase):
+    def setUp(self):
+        self.service = CalendarService()
+        client = caldav.DAVClient(url=CALENDAR_URL)
+        self.service.dest_calendar = caldav.Calendar(client=client, url=CALENDAR_URL)
+        self.events = {
+            CALENDAR_URL + "late.ics": transit_ical("late", "20260110T233000", "20260110T235500"),
+            CALENDAR_URL + "next-day.ics": transit_ical("next-day", "20260111T001500", "20260111T004500"),
+        }
+
+    def server_query(self, calendar, start_date, end_date, include_data):
+        # Like a real server, match floating times in the server's own timezone
+        server_timezone = pytz.timezone("America/Los_Angeles")
+        results = {}
+        for url, data in self.events.items():
+            dtstart = data.split("DTSTART:")[1][:15]
+            event_start = server_timezone.localize(datetime.strptime(dtstart, "%Y%m%dT%H%M%S"))
+            if start_date <= event_start.astimezone(timezone.utc) <= end_date:
+                results[url] = {cdav.CalendarData.tag: data, caldav.dav.GetEtag.tag: '"1"'}
+        return results
+
+    def test_floating_event_near_day_boundary(self):
+        with patch.object(self.service, "_calendar_query", side_effect=self.server_query), \
+                patch.object(self.service, "_delete_event", return_value=True) as delete_event:
+            count = self.service.delete_transit_events_for_date("2026-01-10")
+
+        self.assertEqual(count, 1)
+        deleted = [str(call.args[0].url) for call in delete_event.call_args_list]
+        self.assertEqual(deleted, [CALENDAR_URL + "late.ics"])
+
+
+class BuildTransitIcalTest(unittest.TestCase):
+    def test_non_ascii_lines_are_folded_at_75_octets(self):
+        title = "Café Ünïcødé > 東京都渋谷区神南一丁目 コーヒーショップ " * 3
+        transit_event = {
+            "id": "transit1",
+            "title": title,
+            "origin": "1 Tooth Lane",
+            "destination": "東京都渋谷区神南1-2-3",
+            "startTime": "2026-01-10T08:30:00",
+            "endTime": "2026-01-10T09:00:00",
+        }
+
+        ical = CalendarService()._build_transit_ical(transit_event)
+
+        # Decoding fails if a multi-byte character was split across lines
+        lines = ical.split(b"\r\n")
+        for line in lines:
+            line.decode("utf-8")
+            self.assertLessEqual(len(line), 75)
+
+        unfolded = ical.decode("utf-8").replace("\r\n ", "")
+        self.assertIn(f"SUMMARY:{title}\r\n", unfolded)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,64 @@
+import os
+import sys
+import tempfile
+import unittest
+from datetime import datetime
+from pathlib import Path
+
+# The app's modules import each other flat from src/, and importing the
+# database module creates the SQLite engine, so point it somewhere disposable
+os.environ.setdefault("DB_PATH", os.path.join(tempfile.mkdtemp(), "transit-calendar.sqlite"))
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from database import Event, ProcessedEvent, Session, initialize_db, save_events
+
+
+class SaveEventsTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        initialize_db()
+
+    def setUp(self):
+        self.event_data = {
+            "id": "dentist",
+            "title": "Dentist",
+            "location": "1 Tooth Lane",
+            "startTime": "2026-01-10T09:00:00+00:00",
+            "endTime": "2026-01-10T10:00:00+00:00",
+            "calendarId": "source",
+        }
+
+    def tearDown(self):
+        with Session() as session:
+            session.query(Event).delete()
+            session.query(ProcessedEvent).delete()
+            session.commit()
+
+    def get_event(self):
+        with Session() as session:
+            return session.get(Event, "dentist")
+
+    def test_insert_then_skip_unchanged_then_update(self):
+        first_save = datetime(2026, 1, 1, 8, 0)
+        self.assertEqual(save_events([self.event_data], now=first_save), [("2026-01-10", True)])
+        self.assertEqual(self.get_event().updated_at, first_save)
+
+        # Saving the same event again doesn't write it
+        self.assertEqual(save_events([self.event_data], now=datetime(2026, 1, 1, 8, 5)), [("2026-01-10", False)])
+        self.assertEqual(self.get_event().updated_at, first_save)
+        with Session() as session:
+            self.assertEqual(session.get(ProcessedEvent, "dentist").last_processed, first_save)
+
+        changed_save = datetime(2026, 1, 1, 8, 10)
+        self.event_data["location"] = "2 Tooth Lane"
+        self.assertEqual(save_events([self.event_data], now=changed_save), [("2026-01-10", True)])
+
+        event = self.get_event()
+        self.assertEqual(event.location, "2 Tooth Lane")
+        self.assertEqual(event.updated_at, changed_save)
+        with Session() as session:
+            self.assertEqual(session.get(ProcessedEvent, "dentist").location, "2 Tooth Lane")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,47 @@
+import os
+import sys
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# The app's modules import each other flat from src/, and importing the
+# database module creates the SQLite engine, so point it somewhere disposable
+os.environ.setdefault("DB_PATH", os.path.join(tempfile.mkdtemp(), "transit-calendar.sqlite"))
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from main import MISFIRE_GRACE_TIME, interval_trigger, is_misfire, next_cron_time, next_fire_time
+
+
+class NextFireTimeTest(unittest.TestCase):
+    def test_interval_trigger(self):
+        trigger = interval_trigger(15)
+
+        self.assertEqual(
+            next_fire_time(trigger, datetime(2026, 1, 10, 10, 0), datetime(2026, 1, 10, 10, 2)),
+            datetime(2026, 1, 10, 10, 15)
+        )
+        # Runs missed while the last one overran are combined into one
+        self.assertEqual(
+            next_fire_time(trigger, datetime(2026, 1, 10, 10, 0), datetime(2026, 1, 10, 10, 40)),
+            datetime(2026, 1, 10, 10, 55)
+        )
+
+    def test_cron_trigger_across_midnight(self):
+        self.assertEqual(next_cron_time(datetime(2026, 1, 10, 23, 30), 0, 15), datetime(2026, 1, 11, 0, 15))
+        self.assertEqual(next_cron_time(datetime(2026, 1, 10, 23, 0), 23, 0), datetime(2026, 1, 11, 23, 0))
+        # 2026-01-10 is a Saturday; the weekly job runs on Sunday
+        self.assertEqual(next_cron_time(datetime(2026, 1, 10, 23, 59), 2, 0, day_of_week=6), datetime(2026, 1, 11, 2, 0))
+        self.assertEqual(next_cron_time(datetime(2026, 1, 11, 2, 0), 2, 0, day_of_week=6), datetime(2026, 1, 18, 2, 0))
+
+    def test_misfire_skip(self):
+        run_time = datetime(2026, 1, 10, 10, 0)
+
+        self.assertFalse(is_misfire(run_time, run_time + timedelta(minutes=4), MISFIRE_GRACE_TIME))
+        self.assertTrue(is_misfire(run_time, run_time + timedelta(minutes=6), MISFIRE_GRACE_TIME))
+        # Jobs without a grace time always run, however late
+        self.assertFalse(is_misfire(run_time, run_time + timedelta(days=1), None))
+
+
+if __name__ == "__main__":
+    unittest.main()
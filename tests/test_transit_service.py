@@ -0,0 +1,69 @@
+import os
+import sys
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+# The app's modules import each other flat from src/, and importing the
+# database module creates the SQLite engine, so point it somewhere disposable
+os.environ.setdefault("DB_PATH", os.path.join(tempfile.mkdtemp(), "transit-calendar.sqlite"))
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+import transit_service
+from transit_service import coalesce_request
+
+
+class InFlightRequests(dict):
+    """Records when a second caller looks up a key already in flight"""
+
+    def __init__(self):
+        super().__init__()
+        self.waiter_joined = threading.Event()
+
+    def get(self, key, default=None):
+        if key in self:
+            self.waiter_joined.set()
+        return super().get(key, default)
+
+
+class CoalesceRequestTest(unittest.TestCase):
+    def test_failed_request_is_shared_and_retried(self):
+        in_flight_requests = InFlightRequests()
+        loader_started = threading.Event()
+        key = ("geocode", "1 Tooth Lane")
+        errors = {}
+
+        def failing_loader():
+            loader_started.set()
+            # Only fail once the second caller is waiting on this request
+            self.assertTrue(in_flight_requests.waiter_joined.wait(timeout=5))
+            raise ConnectionError("HERE API unavailable")
+
+        def call(name, loader):
+            try:
+                coalesce_request(key, loader)
+            except Exception as e:
+                errors[name] = e
+
+        with patch.object(transit_service, "in_flight_requests", in_flight_requests):
+            owner = threading.Thread(target=call, args=("owner", failing_loader))
+            owner.start()
+            self.assertTrue(loader_started.wait(timeout=5))
+
+            waiter = threading.Thread(target=call, args=("waiter", lambda: self.fail("waiter made its own request")))
+            waiter.start()
+            owner.join(timeout=5)
+            waiter.join(timeout=5)
+
+            self.assertIsInstance(errors.get("owner"), ConnectionError)
+            self.assertIs(errors.get("waiter"), errors["owner"])
+            self.assertNotIn(key, in_flight_requests)
+
+            # The failure isn't cached; the next caller makes a new request
+            self.assertEqual(coalesce_request(key, lambda: (51.5, -0.1)), (51.5, -0.1))
+
+
+if __name__ == "__main__":
+    unittest.main()